@@ -11,16 +11,34 @@ Plots:
 Output: /Users/tommylees/github/vietnam_coffee_synthetic/artefacts/weather_risk/
 """
 
+import hashlib
+import importlib.metadata
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import geopandas as gpd
+import matplotlib
+
+# Batch script that only writes files - select the non-interactive backend
+# before pyplot is imported
+matplotlib.use("Agg")
+
 import matplotlib.patheffects as path_effects
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import rioxarray  # noqa: F401 - enables rio accessor
+import shapely
 import xarray as xr
+from matplotlib.cm import ScalarMappable
+from matplotlib.collections import LineCollection
+from matplotlib.colors import Normalize
+from numpy.lib.stride_tricks import sliding_window_view
 from rasterio.enums import Resampling
+from rasterio.features import rasterize
+from rasterio.transform import from_bounds
 from scipy.ndimage import gaussian_filter, zoom
 from shapely.geometry import mapping
 
@@ -56,6 +74,12 @@ BOUNDS_PATH = Path("/Users/tommylees/data/weather/boundaries/vnm_adm1.parquet")
 OUTPUT_DIR = Path(
     "/Users/tommylees/github/vietnam_coffee_synthetic/artefacts/weather_risk"
 )
+# Memoised masks and climatology queries, reused between runs
+CACHE_DIR = OUTPUT_DIR / ".cache"
+# File format for the line/bar/scatter charts. "pdf" or "svg" skips the
+# 200 dpi rasterisation and scales losslessly where the printer accepts it;
+# maps and heatmaps are image data and are always written as PNG.
+CHART_FORMAT = "png"
 
 # Distribution configuration for derived statistics
 DIST_CONFIG = {
@@ -95,6 +119,8 @@ plt.rcParams.update(
         "grid.alpha": 0.3,
         "axes.spines.top": False,
         "axes.spines.right": False,
+        # Render long daily series in chunks rather than one huge path
+        "agg.path.chunksize": 10000,
     }
 )
 
@@ -106,16 +132,71 @@ COLOURS = {
     "uncertainty": "#CCCCCC",
 }
 
+# Day-of-season (Oct 1 = Day 1) on which each month starts, with labels.
+# Look up a month for any season day with
+# MONTH_LABELS[MONTH_STARTS.searchsorted(day, side="right") - 1]
+MONTH_STARTS = np.array(
+    [1, 32, 62, 93, 124, 152, 183, 213, 244, 274, 305, 335], dtype=np.int16
+)
+MONTH_LABELS = np.array(
+    ["Oct", "Nov", "Dec", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep"]
+)
+
 
 def get_coffee_region_ids(ds: xr.Dataset, gdf: gpd.GeoDataFrame) -> list:
     """Get geoid values for coffee-growing provinces."""
-    coffee_ids = []
-    for geoid in ds.geoid.values:
-        if geoid in gdf["geoid"].values:
-            name = gdf[gdf["geoid"] == geoid]["geoname"].iloc[0]
-            if name in COFFEE_PROVINCES:
-                coffee_ids.append(geoid)
-    return coffee_ids
+    names = gdf["geoname"].str.strip().str.lower()
+    coffee_geoids = gdf.loc[names.isin(COFFEE_PROVINCES), "geoid"].to_numpy()
+    # Keep the dataset's geoid order
+    geoids = ds.geoid.values
+    return geoids[np.isin(geoids, coffee_geoids)].tolist()
+
+
+def select_geoids(ds: xr.Dataset, coffee_ids: list) -> xr.Dataset:
+    """Select the coffee regions by integer position along ``geoid``.
+
+    Equivalent to ``ds.sel(geoid=coffee_ids)``, but resolving the positions
+    against the index up front lets dask read only the chunks holding those
+    regions from a lazily opened store.
+    """
+    positions = ds.indexes["geoid"].get_indexer(coffee_ids)
+    if (positions < 0).any():
+        missing = np.asarray(coffee_ids)[positions < 0]
+        raise KeyError(f"geoids not found in dataset: {missing.tolist()}")
+    return ds.isel(geoid=positions)
+
+
+def select_coffee_subset(
+    ds: xr.Dataset, variables: list[str], coffee_ids: list
+) -> xr.Dataset:
+    """Keep only the listed variables (where present) and the coffee regions.
+
+    Applied to lazily opened zarr stores before ``.load()`` so that only the
+    data actually plotted is read and decompressed.
+    """
+    ds = ds[[var for var in variables if var in ds.data_vars]]
+    return select_geoids(ds, coffee_ids)
+
+
+def coffee_mean(ds: xr.Dataset, variables: list[str], coffee_ids: list) -> xr.Dataset:
+    """Average the coffee-region subset of ``ds`` over geoid.
+
+    The plots only ever show the coffee-region mean, so the reduction is done
+    once here (lazily, before loading) instead of in every plotting function.
+    """
+    return select_coffee_subset(ds, variables, coffee_ids).mean(dim="geoid")
+
+
+def save_map(fig: plt.Figure, output_path: Path) -> None:
+    """Save and close a map figure.
+
+    Equal-aspect map axes leave margins the layout engine can't remove, so
+    maps are cropped with ``bbox_inches="tight"``. The interpolated grids, not
+    the device, limit detail - 200 dpi is enough.
+    """
+    fig.savefig(output_path, dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    print(f"  Saved: {output_path}")
 
 
 def plot_coffee_regions_map(
@@ -139,7 +220,7 @@ def plot_coffee_regions_map(
     """
     print("Creating coffee regions map...")
 
-    fig, ax = plt.subplots(figsize=(10, 12))
+    fig, ax = plt.subplots(figsize=(10, 12), layout="constrained")
 
     # Plot all provinces in light grey
     gdf_adm1.plot(
@@ -201,10 +282,7 @@ def plot_coffee_regions_map(
     ]
     ax.legend(handles=legend_elements, loc="lower left", fontsize=10)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200, bbox_inches="tight")
-    plt.close()
-    print(f"  Saved: {output_path}")
+    save_map(fig, output_path)
 
 
 def mask_to_boundary(
@@ -234,6 +312,68 @@ def mask_to_boundary(
     return ds.rio.clip(gdf.geometry, gdf.crs, drop=False)
 
 
+def plot_boundary_lines(ax: plt.Axes, gdf: gpd.GeoDataFrame, **kwargs) -> None:
+    """Draw every polygon outline in ``gdf`` as one LineCollection.
+
+    Coordinates for all boundary parts are pulled out in a single vectorised
+    call and split into segments, bypassing GeoDataFrame.plot. Keyword
+    arguments are passed to LineCollection.
+    """
+    parts = shapely.get_parts(gdf.boundary.to_numpy())
+    coords, part_idx = shapely.get_coordinates(parts, return_index=True)
+    segments = np.split(coords, np.flatnonzero(np.diff(part_idx)) + 1)
+    ax.add_collection(LineCollection(segments, **kwargs))
+    ax.autoscale_view()
+
+
+def select_date(ds_grid: xr.Dataset, date: str) -> xr.Dataset:
+    """Load the single time step nearest to ``date`` from a lazily opened grid.
+
+    Resolves the position with the time index and slices with ``isel`` so
+    only the chunks for that step are read, returning in-memory NumPy data.
+    """
+    time_index = ds_grid.indexes["time"]
+    time_idx = time_index.get_indexer([pd.Timestamp(date)], method="nearest")[0]
+    return ds_grid.isel(time=time_idx).load()
+
+
+def grid_snapshot(grid_path: Path, date: str) -> xr.Dataset:
+    """Load the time step nearest to ``date`` via a small single-step zarr.
+
+    The first call extracts the step from the full gridded archive into the
+    cache directory; later calls open the snapshot instead, skipping the
+    archive's chunk graph entirely. The snapshot is rebuilt whenever the
+    archive is newer. A length-1 time dimension is kept so the result can be
+    passed anywhere the full grid is expected.
+    """
+    path = CACHE_DIR / f"snapshot_{grid_path.stem}_{date}.zarr"
+    if path.exists() and path.stat().st_mtime >= grid_path.stat().st_mtime:
+        return xr.open_zarr(path).load()
+
+    ds_grid = xr.open_zarr(grid_path, chunks={})
+    time_index = ds_grid.indexes["time"]
+    time_idx = time_index.get_indexer([pd.Timestamp(date)], method="nearest")
+    snapshot = ds_grid.isel(time=time_idx).load()
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    snapshot.to_zarr(path, mode="w", consolidated=True)
+    return snapshot
+
+
+def is_kelvin(temp: np.ndarray, n_probe: int = 64) -> bool:
+    """Guess whether temperatures are in Kelvin from a few valid cells.
+
+    Any plausible near-surface temperature above 100 must be Kelvin, so
+    averaging the first ``n_probe`` non-NaN values is enough. Only the
+    leading block of cells is scanned unless it is entirely masked out.
+    """
+    flat = temp.ravel()
+    valid = flat[:4096][~np.isnan(flat[:4096])]
+    if valid.size == 0:
+        valid = flat[~np.isnan(flat)]
+    return valid.size > 0 and valid[:n_probe].mean() > 100
+
+
 def plot_gridded_weather_map(
     ds_grid: xr.Dataset,
     gdf_adm0: gpd.GeoDataFrame,
@@ -249,18 +389,18 @@ def plot_gridded_weather_map(
     print("Creating gridded weather map...")
 
     # Select single date
-    ds = ds_grid.sel(time=date, method="nearest")
+    ds = select_date(ds_grid, date)
 
     # Mask to Vietnam ADM0 boundary
     ds_masked = mask_to_boundary(ds, gdf_adm0)
 
-    fig, axes = plt.subplots(1, 2, figsize=(12, 10))
+    fig, axes = plt.subplots(1, 2, figsize=(12, 10), layout="constrained")
 
     # Temperature map
     ax1 = axes[0]
     temp = ds_masked["2m_temperature"]
     # Convert from Kelvin to Celsius if needed
-    if np.nanmean(temp.values) > 100:  # Likely in Kelvin
+    if is_kelvin(temp.values):
         temp = temp - 273.15
     im1 = temp.plot(
         ax=ax1,
@@ -269,7 +409,7 @@ def plot_gridded_weather_map(
         cbar_kwargs={"label": "Temperature (°C)", "shrink": 0.7},
     )
     gdf_adm0.boundary.plot(ax=ax1, color="black", linewidth=1.5)
-    gdf_adm1.boundary.plot(ax=ax1, color="grey", linewidth=0.5, alpha=0.7)
+    plot_boundary_lines(ax1, gdf_adm1, colors="grey", linewidths=0.5, alpha=0.7)
     ax1.set_title(f"Temperature - {date}")
     ax1.set_xlabel("Longitude")
     ax1.set_ylabel("Latitude")
@@ -287,7 +427,7 @@ def plot_gridded_weather_map(
         vmin=0,
     )
     gdf_adm0.boundary.plot(ax=ax2, color="black", linewidth=1.5)
-    gdf_adm1.boundary.plot(ax=ax2, color="grey", linewidth=0.5, alpha=0.7)
+    plot_boundary_lines(ax2, gdf_adm1, colors="grey", linewidths=0.5, alpha=0.7)
     ax2.set_title(f"Precipitation - {date}")
     ax2.set_xlabel("Longitude")
     ax2.set_ylabel("Latitude")
@@ -296,12 +436,8 @@ def plot_gridded_weather_map(
         "Vietnam ERA5 Weather Data",
         fontsize=14,
         fontweight="bold",
-        y=1.02,
     )
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200, bbox_inches="tight")
-    plt.close()
-    print(f"  Saved: {output_path}")
+    save_map(fig, output_path)
 
 
 def interpolate_to_high_res(
@@ -339,20 +475,23 @@ def interpolate_to_high_res(
     # Calculate zoom factor
     zoom_factor = current_res_km / target_res_km
 
+    # Work in float32 - ample for temperature/precipitation maps and halves
+    # the memory traffic of the zoom and smoothing passes
+    data = data.astype(np.float32)
+
     # Handle NaN values by interpolating them first
     mask = np.isnan(data)
-    data_filled = data.copy()
+    data_filled = data
     if mask.any():
-        # Simple fill with nearest valid value for interpolation
-        from scipy.ndimage import distance_transform_edt
-        indices = distance_transform_edt(mask, return_distances=False, return_indices=True)
-        data_filled = data_filled[tuple(indices)]
+        # Constant fill with the mean - the high-res mask is re-applied
+        # afterwards, so only cells near the boundary see the fill value
+        data_filled = np.where(mask, np.nanmean(data), data)
 
     # Zoom to higher resolution
     data_highres = zoom(data_filled, zoom_factor, order=3)  # cubic interpolation
 
-    # Apply gaussian smoothing
-    data_highres = gaussian_filter(data_highres, sigma=sigma)
+    # Apply gaussian smoothing in place (separable 1D passes)
+    gaussian_filter(data_highres, sigma=sigma, output=data_highres)
 
     # Create new coordinate arrays
     lat_highres = np.linspace(lat.min(), lat.max(), data_highres.shape[0])
@@ -360,29 +499,55 @@ def interpolate_to_high_res(
 
     # Re-apply mask at high resolution
     if mask.any():
-        mask_highres = zoom(mask.astype(float), zoom_factor, order=0) > 0.5
+        mask_highres = zoom(mask.view(np.uint8), zoom_factor, order=0).view(bool)
         data_highres[mask_highres] = np.nan
 
     return data_highres, lat_highres, lon_highres
 
 
 def create_highres_mask(
-    gdf: gpd.GeoDataFrame, lat: np.ndarray, lon: np.ndarray
+    boundary: shapely.Geometry, lat: np.ndarray, lon: np.ndarray
 ) -> np.ndarray:
-    """Create a boolean mask for high-res grid from polygon boundary."""
-    from shapely.geometry import Point
-
-    # Create meshgrid of coordinates
-    lon_grid, lat_grid = np.meshgrid(lon, lat)
-
-    # Get the union of all geometries
-    boundary = gdf.union_all()
-
-    # Check each point - vectorized approach
-    mask = np.zeros(lon_grid.shape, dtype=bool)
-    for i in range(lat_grid.shape[0]):
-        for j in range(lat_grid.shape[1]):
-            mask[i, j] = boundary.contains(Point(lon_grid[i, j], lat_grid[i, j]))
+    """Create a boolean mask for high-res grid from a (multi)polygon boundary.
+
+    Burns the polygons into the grid with rasterio's scanline fill, which
+    tests each cell centre just like a point-in-polygon check but in C.
+    Assumes ``lat``/``lon`` are regularly spaced cell centres. Grids with a
+    single row or column have no cell size to build a raster transform from,
+    so fall back to point-in-polygon tests against an STRtree of the boundary
+    parts, which only runs exact checks on bounding-box candidates.
+    """
+    if len(lat) < 2 or len(lon) < 2:
+        lon_grid, lat_grid = np.meshgrid(lon, lat)
+        tree = shapely.STRtree(shapely.get_parts(boundary))
+        points = shapely.points(lon_grid.ravel(), lat_grid.ravel())
+        point_idx, _ = tree.query(points, predicate="within")
+        mask = np.zeros(lon_grid.shape, dtype=bool)
+        mask.flat[point_idx] = True
+        return mask
+
+    # Cell edges are half a step beyond the outermost centres
+    half_lat = abs(lat[1] - lat[0]) / 2
+    half_lon = abs(lon[1] - lon[0]) / 2
+    transform = from_bounds(
+        lon.min() - half_lon,
+        lat.min() - half_lat,
+        lon.max() + half_lon,
+        lat.max() + half_lat,
+        len(lon),
+        len(lat),
+    )
+    mask = rasterize(
+        [(boundary, 1)],
+        out_shape=(len(lat), len(lon)),
+        transform=transform,
+        fill=0,
+        dtype="uint8",
+    ).astype(bool)
+
+    # Rasterized rows run north to south; flip to match ascending latitudes
+    if lat[0] < lat[-1]:
+        mask = mask[::-1]
 
     return mask
 
@@ -394,28 +559,30 @@ def plot_gridded_weather_map_highres(
     output_path: Path,
     date: str = "2024-03-15",
     target_res_km: float = 1.0,
+    adm0_union: shapely.Geometry | None = None,
 ) -> None:
     """Plot high-resolution interpolated weather data cropped to Vietnam boundary.
 
     Uses scipy zoom and gaussian filter to downscale from ~25km to ~1km resolution.
-    Axes are hidden for a cleaner presentation.
+    Axes are hidden for a cleaner presentation. Pass ``adm0_union`` (the
+    dissolved ADM0 geometry) to reuse a union computed by the caller.
     """
     print("Creating high-resolution gridded weather map...")
 
     # Select single date
-    ds = ds_grid.sel(time=date, method="nearest")
+    ds = select_date(ds_grid, date)
 
     # Get coordinate arrays (before masking, for full interpolation)
     lat = ds.latitude.values
     lon = ds.longitude.values
 
-    fig, axes = plt.subplots(1, 2, figsize=(12, 10))
+    fig, axes = plt.subplots(1, 2, figsize=(12, 10), layout="constrained")
 
     # Temperature map
     ax1 = axes[0]
     temp = ds["2m_temperature"].values
     # Convert from Kelvin to Celsius if needed
-    if np.nanmean(temp) > 100:
+    if is_kelvin(temp):
         temp = temp - 273.15
 
     # Interpolate to high resolution (without mask first for smooth interpolation)
@@ -423,25 +590,41 @@ def plot_gridded_weather_map_highres(
         temp, lat, lon, target_res_km=target_res_km, sigma=2.0
     )
 
-    # Create high-res mask using rasterio clip approach
-    # Build a temporary high-res dataset to clip
-    temp_da = xr.DataArray(
-        temp_hr,
-        dims=["latitude", "longitude"],
-        coords={"latitude": lat_hr, "longitude": lon_hr},
-    )
-    temp_da = temp_da.rio.write_crs("EPSG:4326")
-    temp_da = temp_da.rio.set_spatial_dims(x_dim="longitude", y_dim="latitude")
-    temp_clipped = temp_da.rio.clip(gdf_adm0.geometry, gdf_adm0.crs, drop=False)
+    # Rasterize the boundary once on the high-res grid; both variables share it
+    if adm0_union is None:
+        adm0_union = gdf_adm0.union_all()
+    mask_hr = cached_highres_mask(adm0_union, lat_hr, lon_hr)
+    temp_hr = np.where(mask_hr, temp_hr, np.nan)
+
+    # Regular grid, so draw it as a single image rather than a quad mesh.
+    # Extent covers the cell edges, half a step beyond the outer centres.
+    half_lat = (lat_hr[1] - lat_hr[0]) / 2
+    half_lon = (lon_hr[1] - lon_hr[0]) / 2
+    extent = [
+        lon_hr[0] - half_lon,
+        lon_hr[-1] + half_lon,
+        lat_hr[0] - half_lat,
+        lat_hr[-1] + half_lat,
+    ]
 
-    im1 = ax1.pcolormesh(
-        lon_hr, lat_hr, temp_clipped.values,
-        cmap="RdYlBu_r",
-        shading="auto",
+    # Colour-map to 8-bit RGBA up front (NaNs become transparent) so the
+    # image is drawn and encoded as bytes; the colorbar gets its own mappable
+    temp_norm = Normalize(vmin=np.nanmin(temp_hr), vmax=np.nanmax(temp_hr))
+    temp_cmap = plt.get_cmap("RdYlBu_r")
+    ax1.imshow(
+        temp_cmap(temp_norm(temp_hr), bytes=True),
+        extent=extent,
+        origin="lower",
+        interpolation="nearest",
+    )
+    plt.colorbar(
+        ScalarMappable(norm=temp_norm, cmap=temp_cmap),
+        ax=ax1,
+        label="Temperature (°C)",
+        shrink=0.7,
     )
-    plt.colorbar(im1, ax=ax1, label="Temperature (°C)", shrink=0.7)
     gdf_adm0.boundary.plot(ax=ax1, color="black", linewidth=1.5)
-    gdf_adm1.boundary.plot(ax=ax1, color="grey", linewidth=0.5, alpha=0.7)
+    plot_boundary_lines(ax1, gdf_adm1, colors="grey", linewidths=0.5, alpha=0.7)
     ax1.set_aspect("equal")
     ax1.axis("off")
 
@@ -451,89 +634,203 @@ def plot_gridded_weather_map_highres(
     # Convert from m to mm
     precip_mm = precip * 1000
 
-    # Interpolate to high resolution
-    precip_hr, lat_hr, lon_hr = interpolate_to_high_res(
+    # Interpolate to high resolution (same grid as temperature)
+    precip_hr, _, _ = interpolate_to_high_res(
         precip_mm, lat, lon, target_res_km=target_res_km, sigma=2.0
     )
 
     # Clip to boundary
-    precip_da = xr.DataArray(
-        precip_hr,
-        dims=["latitude", "longitude"],
-        coords={"latitude": lat_hr, "longitude": lon_hr},
+    precip_hr = np.where(mask_hr, precip_hr, np.nan)
+
+    precip_norm = Normalize(vmin=0, vmax=np.nanmax(precip_hr))
+    precip_cmap = plt.get_cmap("Blues")
+    ax2.imshow(
+        precip_cmap(precip_norm(precip_hr), bytes=True),
+        extent=extent,
+        origin="lower",
+        interpolation="nearest",
     )
-    precip_da = precip_da.rio.write_crs("EPSG:4326")
-    precip_da = precip_da.rio.set_spatial_dims(x_dim="longitude", y_dim="latitude")
-    precip_clipped = precip_da.rio.clip(gdf_adm0.geometry, gdf_adm0.crs, drop=False)
-
-    im2 = ax2.pcolormesh(
-        lon_hr, lat_hr, precip_clipped.values,
-        cmap="Blues",
-        shading="auto",
-        vmin=0,
+    plt.colorbar(
+        ScalarMappable(norm=precip_norm, cmap=precip_cmap),
+        ax=ax2,
+        label="Precipitation (mm/day)",
+        shrink=0.7,
     )
-    plt.colorbar(im2, ax=ax2, label="Precipitation (mm/day)", shrink=0.7)
     gdf_adm0.boundary.plot(ax=ax2, color="black", linewidth=1.5)
-    gdf_adm1.boundary.plot(ax=ax2, color="grey", linewidth=0.5, alpha=0.7)
+    plot_boundary_lines(ax2, gdf_adm1, colors="grey", linewidths=0.5, alpha=0.7)
     ax2.set_aspect("equal")
     ax2.axis("off")
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
-    plt.close()
-    print(f"  Saved: {output_path}")
+    save_map(fig, output_path)
 
 
-def plot_time_series_with_climatology(
-    ds_agg: xr.Dataset,
+def _hash_array(digest, values: np.ndarray) -> None:
+    """Feed an array's dtype, shape and raw bytes into ``digest``."""
+    values = np.asarray(values)
+    if values.dtype == object:
+        # Object arrays hold pointers, so hash their fixed-width strings
+        values = values.astype(str)
+    digest.update(repr((values.dtype.str, values.shape)).encode())
+    digest.update(np.ascontiguousarray(values).tobytes())
+
+
+def cache_key(*parts: object) -> str:
+    """Hash arrays, datasets and plain values into a key for the disk cache.
+
+    Datasets contribute each variable's name, dims, attrs, dtype, shape and
+    raw bytes, plus the dataset attrs.
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        if isinstance(part, xr.Dataset):
+            digest.update(repr(sorted(part.attrs.items())).encode())
+            for name in sorted(part.variables, key=str):
+                var = part.variables[name]
+                digest.update(repr((name, var.dims, sorted(var.attrs.items()))).encode())
+                _hash_array(digest, var.values)
+        elif isinstance(part, np.ndarray):
+            _hash_array(digest, part)
+        else:
+            digest.update(repr(part).encode())
+    return digest.hexdigest()
+
+
+def cached_highres_mask(
+    boundary: shapely.Geometry, lat: np.ndarray, lon: np.ndarray
+) -> np.ndarray:
+    """create_highres_mask, memoised on disk by boundary geometry and grid."""
+    path = CACHE_DIR / f"mask_{cache_key(shapely.to_wkb(boundary), lat, lon)}.npy"
+    if path.exists():
+        return np.load(path)
+
+    mask = create_highres_mask(boundary, lat, lon)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    np.save(path, mask)
+    return mask
+
+
+def coffee_climatology(
     ds_clim: xr.Dataset,
     coffee_ids: list,
-    output_path: Path,
+    time: pd.DatetimeIndex,
     polys: xr.Dataset | None = None,
     transforms: xr.Dataset | None = None,
-) -> None:
-    """Plot time series of temperature and precipitation vs climatology.
+) -> xr.Dataset:
+    """Query climatology statistics for the coffee regions, averaged over them.
 
-    Uses query_climatology with retrend to get temperature back to original scale,
-    and compute_statistics to get proper derived statistics (mean, sigma bounds).
-    Applies 30-day rolling to climatology to match rolling actuals.
+    Uses query_climatology with retrend (when trend parameters are given) to
+    get temperature back to the original scale, and compute_statistics for
+    the mean and sigma bounds. Results are cached on disk keyed by all inputs,
+    so re-running the script skips the query.
     """
-    print("Creating time series plot...")
-
-    fig, axes = plt.subplots(2, 1, figsize=(14, 8), sharex=True)
-
-    # Select 2020-2025 and coffee regions
-    ds = ds_agg.sel(time=slice("2020-01-01", "2025-12-31"))
-    ds_coffee = ds.sel(geoid=coffee_ids).mean(dim="geoid")
-
-    time = pd.to_datetime(ds_coffee.time.values)
+    ds_clim = ds_clim.sel(geoid=coffee_ids)
+    polys = polys.sel(geoid=coffee_ids) if polys is not None else None
+    transforms = transforms.sel(geoid=coffee_ids) if transforms is not None else None
+    retrend = polys is not None
+    statistics = ["mean", "sigma_lower", "sigma_upper"]
+
+    # Key on the query settings and library version too, so changing any of
+    # them invalidates the cached result rather than serving it stale
+    path = CACHE_DIR / (
+        "clim_"
+        + cache_key(
+            ds_clim,
+            polys if polys is not None else "no-polys",
+            transforms if transforms is not None else "no-transforms",
+            time.values,
+            repr(DIST_CONFIG),
+            statistics,
+            retrend,
+            importlib.metadata.version("tf-data-ml-utils"),
+        )
+        + ".zarr"
+    )
+    if path.exists():
+        return xr.open_zarr(path).load()
 
     # Query climatology with retrend to get back to original temperature scale
     # This adds the trend back to detrended temperature variables
     clim_queried = query_climatology(
-        ds_clim.sel(geoid=coffee_ids),
+        ds_clim,
         time,
-        polys=polys.sel(geoid=coffee_ids) if polys is not None else None,
-        transforms=transforms.sel(geoid=coffee_ids) if transforms is not None else None,
-        retrend=polys is not None,
+        polys=polys,
+        transforms=transforms,
+        retrend=retrend,
     )
 
     # Compute derived statistics (mean, sigma_lower, sigma_upper) from distribution params
     clim_stats = compute_statistics(
         clim_queried,
-        statistics=["mean", "sigma_lower", "sigma_upper"],
+        statistics=statistics,
         dist_config=DIST_CONFIG,
     )
 
     # Average over coffee regions
-    clim_coffee = clim_stats.mean(dim="geoid")
+    clim_coffee = clim_stats.mean(dim="geoid").load()
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    clim_coffee.to_zarr(path, mode="w")
+    return clim_coffee
+
+
+def rolling_centered(values: np.ndarray, window: int, reduce=np.mean) -> np.ndarray:
+    """Centred rolling ``reduce`` (e.g. np.mean, np.sum) along the first axis.
+
+    Matches pandas ``rolling(window, center=True)`` with the default
+    ``min_periods``: positions without a full window, or whose window holds
+    a NaN, are NaN. Windows are strided views, so nothing is copied.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        windows = sliding_window_view(values, window, axis=0)
+        start = window // 2
+        out[start : start + len(windows)] = reduce(windows, axis=-1)
+    return out
+
+
+def plot_time_series_with_climatology(
+    ds_agg_coffee: xr.Dataset,
+    ds_clim: xr.Dataset,
+    coffee_ids: list,
+    output_path: Path,
+    polys: xr.Dataset | None = None,
+    transforms: xr.Dataset | None = None,
+) -> None:
+    """Plot time series of temperature and precipitation vs climatology.
+
+    Uses query_climatology with retrend to get temperature back to original scale,
+    and compute_statistics to get proper derived statistics (mean, sigma bounds).
+    Applies 30-day rolling to climatology to match rolling actuals.
+    """
+    print("Creating time series plot...")
+
+    fig, axes = plt.subplots(
+        2, 1, figsize=(14, 8), sharex=True, layout="constrained"
+    )
+
+    # Select 2020-2025 of the coffee-region mean
+    ds_coffee = ds_agg_coffee.sel(time=slice("2020-01-01", "2025-12-31"))
+
+    time = ds_coffee.indexes["time"]
+
+    # Climatology mean/sigma bounds for the coffee regions (cached on disk),
+    # pulled out in one selection as (time, statistic) arrays per variable
+    clim_coffee = coffee_climatology(ds_clim, coffee_ids, time, polys, transforms)
+    clim_bounds = clim_coffee[["tas", "pr"]].sel(
+        statistic=["mean", "sigma_lower", "sigma_upper"]
+    ).transpose(..., "statistic")
 
     # Temperature plot
     ax1 = axes[0]
     tas = ds_coffee["tas"].values
 
-    # 30-day rolling mean for actuals
-    tas_smooth = pd.Series(tas).rolling(30, center=True).mean()
+    # 30-day rolling mean for actuals and climatology, in one batched pass
+    tas_smooth, clim_tas_mean, clim_tas_lower, clim_tas_upper = rolling_centered(
+        np.column_stack([tas, clim_bounds["tas"].values]),
+        30,
+        np.mean,
+    ).T
 
     ax1.plot(
         time,
@@ -543,17 +840,6 @@ def plot_time_series_with_climatology(
         label="Actual (30-day mean)",
     )
 
-    # 30-day rolling for climatology to match
-    clim_tas_mean = pd.Series(
-        clim_coffee["tas"].sel(statistic="mean").values
-    ).rolling(30, center=True).mean()
-    clim_tas_lower = pd.Series(
-        clim_coffee["tas"].sel(statistic="sigma_lower").values
-    ).rolling(30, center=True).mean()
-    clim_tas_upper = pd.Series(
-        clim_coffee["tas"].sel(statistic="sigma_upper").values
-    ).rolling(30, center=True).mean()
-
     ax1.fill_between(
         time,
         clim_tas_lower,
@@ -577,13 +863,17 @@ def plot_time_series_with_climatology(
 
     # Precipitation plot
     ax2 = axes[1]
-    pr = ds_coffee["pr"].values
+    pr = ds_coffee["pr"].values.copy()
 
     # Mask precipitation where temperature is NaN (data ends)
-    pr = np.where(np.isnan(tas), np.nan, pr)
+    pr[np.isnan(tas)] = np.nan
 
-    # 30-day rolling sum for actuals
-    pr_smooth = pd.Series(pr).rolling(30, center=True).sum()
+    # 30-day rolling sum for actuals and climatology, in one batched pass
+    pr_smooth, clim_pr_mean, clim_pr_lower, clim_pr_upper = rolling_centered(
+        np.column_stack([pr, clim_bounds["pr"].values]),
+        30,
+        np.sum,
+    ).T
 
     ax2.plot(
         time,
@@ -593,19 +883,8 @@ def plot_time_series_with_climatology(
         label="Actual (30-day sum)",
     )
 
-    # 30-day rolling sum for climatology (cumsum over rolling window)
-    clim_pr_mean = pd.Series(
-        clim_coffee["pr"].sel(statistic="mean").values
-    ).rolling(30, center=True).sum()
-    clim_pr_lower = pd.Series(
-        clim_coffee["pr"].sel(statistic="sigma_lower").values
-    ).rolling(30, center=True).sum()
-    clim_pr_upper = pd.Series(
-        clim_coffee["pr"].sel(statistic="sigma_upper").values
-    ).rolling(30, center=True).sum()
-
     # Clip lower bound at 0 for precipitation
-    clim_pr_lower = clim_pr_lower.clip(lower=0)
+    clim_pr_lower = np.maximum(clim_pr_lower, 0)
 
     ax2.fill_between(
         time,
@@ -653,14 +932,13 @@ def plot_time_series_with_climatology(
         except Exception:
             pass
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200, bbox_inches="tight")
+    plt.savefig(output_path, dpi=200)
     plt.close()
     print(f"  Saved: {output_path}")
 
 
 def plot_time_series_with_climatology_minimal(
-    ds_agg: xr.Dataset,
+    ds_agg_coffee: xr.Dataset,
     ds_clim: xr.Dataset,
     coffee_ids: list,
     output_path: Path,
@@ -676,39 +954,32 @@ def plot_time_series_with_climatology_minimal(
     """
     print("Creating minimal time series plot...")
 
-    fig, axes = plt.subplots(2, 1, figsize=(14, 8), sharex=True)
-
-    # Select 2020-2025 and coffee regions
-    ds = ds_agg.sel(time=slice("2020-01-01", "2025-12-31"))
-    ds_coffee = ds.sel(geoid=coffee_ids).mean(dim="geoid")
-
-    time = pd.to_datetime(ds_coffee.time.values)
-
-    # Query climatology with retrend to get back to original temperature scale
-    clim_queried = query_climatology(
-        ds_clim.sel(geoid=coffee_ids),
-        time,
-        polys=polys.sel(geoid=coffee_ids) if polys is not None else None,
-        transforms=transforms.sel(geoid=coffee_ids) if transforms is not None else None,
-        retrend=polys is not None,
+    fig, axes = plt.subplots(
+        2, 1, figsize=(14, 8), sharex=True, layout="constrained"
     )
 
-    # Compute derived statistics from distribution params
-    clim_stats = compute_statistics(
-        clim_queried,
-        statistics=["mean", "sigma_lower", "sigma_upper"],
-        dist_config=DIST_CONFIG,
-    )
+    # Select 2020-2025 of the coffee-region mean
+    ds_coffee = ds_agg_coffee.sel(time=slice("2020-01-01", "2025-12-31"))
 
-    # Average over coffee regions
-    clim_coffee = clim_stats.mean(dim="geoid")
+    time = ds_coffee.indexes["time"]
+
+    # Climatology mean/sigma bounds for the coffee regions (cached on disk),
+    # pulled out in one selection as (time, statistic) arrays per variable
+    clim_coffee = coffee_climatology(ds_clim, coffee_ids, time, polys, transforms)
+    clim_bounds = clim_coffee[["tas", "pr"]].sel(
+        statistic=["mean", "sigma_lower", "sigma_upper"]
+    ).transpose(..., "statistic")
 
     # Temperature plot
     ax1 = axes[0]
     tas = ds_coffee["tas"].values
 
-    # 30-day rolling mean for actuals
-    tas_smooth = pd.Series(tas).rolling(30, center=True).mean()
+    # 30-day rolling mean for actuals and climatology, in one batched pass
+    tas_smooth, clim_tas_mean, clim_tas_lower, clim_tas_upper = rolling_centered(
+        np.column_stack([tas, clim_bounds["tas"].values]),
+        30,
+        np.mean,
+    ).T
 
     ax1.plot(
         time,
@@ -718,17 +989,6 @@ def plot_time_series_with_climatology_minimal(
         label="Actual (30-day mean)",
     )
 
-    # 30-day rolling for climatology
-    clim_tas_mean = pd.Series(
-        clim_coffee["tas"].sel(statistic="mean").values
-    ).rolling(30, center=True).mean()
-    clim_tas_lower = pd.Series(
-        clim_coffee["tas"].sel(statistic="sigma_lower").values
-    ).rolling(30, center=True).mean()
-    clim_tas_upper = pd.Series(
-        clim_coffee["tas"].sel(statistic="sigma_upper").values
-    ).rolling(30, center=True).mean()
-
     ax1.fill_between(
         time,
         clim_tas_lower,
@@ -752,13 +1012,17 @@ def plot_time_series_with_climatology_minimal(
 
     # Precipitation plot
     ax2 = axes[1]
-    pr = ds_coffee["pr"].values
+    pr = ds_coffee["pr"].values.copy()
 
     # Mask precipitation where temperature is NaN
-    pr = np.where(np.isnan(tas), np.nan, pr)
+    pr[np.isnan(tas)] = np.nan
 
-    # 30-day rolling sum for actuals
-    pr_smooth = pd.Series(pr).rolling(30, center=True).sum()
+    # 30-day rolling sum for actuals and climatology, in one batched pass
+    pr_smooth, clim_pr_mean, clim_pr_lower, clim_pr_upper = rolling_centered(
+        np.column_stack([pr, clim_bounds["pr"].values]),
+        30,
+        np.sum,
+    ).T
 
     ax2.plot(
         time,
@@ -768,19 +1032,8 @@ def plot_time_series_with_climatology_minimal(
         label="Actual (30-day sum)",
     )
 
-    # 30-day rolling sum for climatology
-    clim_pr_mean = pd.Series(
-        clim_coffee["pr"].sel(statistic="mean").values
-    ).rolling(30, center=True).sum()
-    clim_pr_lower = pd.Series(
-        clim_coffee["pr"].sel(statistic="sigma_lower").values
-    ).rolling(30, center=True).sum()
-    clim_pr_upper = pd.Series(
-        clim_coffee["pr"].sel(statistic="sigma_upper").values
-    ).rolling(30, center=True).sum()
-
     # Clip lower bound at 0 for precipitation
-    clim_pr_lower = clim_pr_lower.clip(lower=0)
+    clim_pr_lower = np.maximum(clim_pr_lower, 0)
 
     ax2.fill_between(
         time,
@@ -825,24 +1078,19 @@ def plot_time_series_with_climatology_minimal(
         except Exception:
             pass
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200, bbox_inches="tight")
+    plt.savefig(output_path, dpi=200)
     plt.close()
     print(f"  Saved: {output_path}")
 
 
 def plot_monthly_anomalies(
-    ds_anomalies: xr.Dataset,
-    coffee_ids: list,
+    ds: xr.Dataset,
     output_path: Path,
 ) -> None:
-    """Plot monthly anomaly heatmap."""
+    """Plot monthly anomaly heatmap of the coffee-region mean anomalies."""
     print("Creating monthly anomalies plot...")
 
-    fig, axes = plt.subplots(2, 1, figsize=(14, 8))
-
-    # Select coffee regions
-    ds = ds_anomalies.sel(geoid=coffee_ids).mean(dim="geoid")
+    fig, axes = plt.subplots(2, 1, figsize=(14, 8), layout="constrained")
 
     for idx, (var, ax, cmap, label) in enumerate(
         [
@@ -856,16 +1104,22 @@ def plot_monthly_anomalies(
         # Convert to monthly
         monthly = ds[var].resample(time="ME").mean()
 
-        # Pivot to year x month
-        df = monthly.to_dataframe().reset_index()
-        df["year"] = pd.to_datetime(df["time"]).dt.year
-        df["month"] = pd.to_datetime(df["time"]).dt.month
-
-        pivot = df.pivot(index="year", columns="month", values=var)
-
-        # Plot heatmap
-        vmax = max(abs(pivot.values.min()), abs(pivot.values.max()))
-        im = ax.imshow(pivot.values, cmap=cmap, aspect="auto", vmin=-vmax, vmax=vmax)
+        # Fold to year x month: months since 1970-01, padded with NaN to
+        # whole calendar years, reshape directly into a (n_years, 12) grid
+        months = monthly.time.values.astype("datetime64[M]").astype(np.int64)
+        first_month = months[0] - months[0] % 12
+        n_years = (months[-1] - first_month) // 12 + 1
+        # float32 is plenty - the colormap quantises to 8 bits anyway
+        pivot = np.full(n_years * 12, np.nan, dtype=np.float32)
+        pivot[months - first_month] = monthly.values
+        pivot = pivot.reshape(n_years, 12)
+        years = 1970 + first_month // 12 + np.arange(n_years)
+
+        # Plot heatmap, symmetric about zero; the padding NaNs are ignored
+        vmax = float(np.nanmax(np.abs(pivot)))
+        # Explicit norm, so neither imshow nor the colorbar rescan the data
+        norm = Normalize(vmin=-vmax, vmax=vmax)
+        im = ax.imshow(pivot, cmap=cmap, aspect="auto", norm=norm)
 
         ax.set_xticks(range(12))
         ax.set_xticklabels(
@@ -884,44 +1138,43 @@ def plot_monthly_anomalies(
                 "Dec",
             ]
         )
-        ax.set_yticks(range(len(pivot.index)))
-        ax.set_yticklabels(pivot.index)
+        ax.set_yticks(range(n_years))
+        ax.set_yticklabels(years)
         ax.set_ylabel("Year")
         ax.set_title(label)
 
-        plt.colorbar(im, ax=ax, shrink=0.6)
+        fig.colorbar(im, ax=ax, shrink=0.6)
 
     plt.suptitle(
         "Central Highlands Coffee Regions - Monthly Anomalies",
         fontsize=14,
         fontweight="bold",
-        y=1.02,
     )
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200, bbox_inches="tight")
+    plt.savefig(output_path, dpi=200)
     plt.close()
     print(f"  Saved: {output_path}")
 
 
 def plot_index_dashboard(
-    ds_indices: xr.Dataset,
-    coffee_ids: list,
+    ds: xr.Dataset,
     output_path: Path,
 ) -> None:
-    """Create a dashboard of climate indices."""
+    """Create a dashboard of climate indices for the coffee-region mean."""
     print("Creating index dashboard...")
 
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), layout="constrained")
 
-    # Select coffee regions
-    ds = ds_indices.sel(geoid=coffee_ids).mean(dim="geoid")
+    # GDD and EDD share the annual bins - resample them together in one pass
+    annual_vars = [var for var in ("gdd", "edd") if var in ds]
+    if annual_vars:
+        annual = ds[annual_vars].resample(time="YE").sum()
+        years = annual.indexes["time"].year
 
     # GDD cumulative
     ax1 = axes[0, 0]
     if "gdd" in ds:
         # Annual cumulative GDD
-        gdd_annual = ds["gdd"].resample(time="YE").sum()
-        years = pd.to_datetime(gdd_annual.time.values).year
+        gdd_annual = annual["gdd"]
         ax1.bar(years, gdd_annual.values, color=COLOURS["actual"])
         ax1.axhline(
             gdd_annual.mean(),
@@ -936,15 +1189,15 @@ def plot_index_dashboard(
     # EDD cumulative
     ax2 = axes[0, 1]
     if "edd" in ds:
-        edd_annual = ds["edd"].resample(time="YE").sum()
-        years = pd.to_datetime(edd_annual.time.values).year
-        colours = [
-            COLOURS["anomaly_pos"] if v > edd_annual.mean() else COLOURS["actual"]
-            for v in edd_annual.values
-        ]
+        edd_annual = annual["edd"]
+        edd_mean = float(edd_annual.mean())
+        # Above-average years in red, computed against a single mean
+        colours = np.where(
+            edd_annual.values > edd_mean, COLOURS["anomaly_pos"], COLOURS["actual"]
+        )
         ax2.bar(years, edd_annual.values, color=colours)
         ax2.axhline(
-            edd_annual.mean(),
+            edd_mean,
             color=COLOURS["climatology"],
             linestyle="--",
             label="Mean",
@@ -958,7 +1211,7 @@ def plot_index_dashboard(
     if "dry_day" in ds:
         # Monthly dry day count
         dry_monthly = ds["dry_day"].resample(time="ME").sum()
-        time = pd.to_datetime(dry_monthly.time.values)
+        time = dry_monthly.indexes["time"]
         ax3.fill_between(
             time, 0, dry_monthly.values, color=COLOURS["anomaly_neg"], alpha=0.7
         )
@@ -969,8 +1222,8 @@ def plot_index_dashboard(
     ax4 = axes[1, 1]
     if "swvl_mean" in ds:
         swvl = ds["swvl_mean"]
-        time = pd.to_datetime(swvl.time.values)
-        swvl_smooth = pd.Series(swvl.values).rolling(30, center=True).mean()
+        time = swvl.indexes["time"]
+        swvl_smooth = rolling_centered(swvl.values, 30, np.mean)
         ax4.plot(time, swvl_smooth, color=COLOURS["actual"], linewidth=1.5)
         ax4.axhline(
             swvl.mean(), color=COLOURS["climatology"], linestyle="--", label="Mean"
@@ -984,15 +1237,13 @@ def plot_index_dashboard(
         fontsize=14,
         fontweight="bold",
     )
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200, bbox_inches="tight")
+    plt.savefig(output_path, dpi=200)
     plt.close()
     print(f"  Saved: {output_path}")
 
 
 def plot_dayofyear_indices(
-    ds_indices: xr.Dataset,
-    coffee_ids: list,
+    ds: xr.Dataset,
     output_path: Path,
     current_season: str = "2024-2025",
 ) -> None:
@@ -1010,10 +1261,9 @@ def plot_dayofyear_indices(
 
     Parameters
     ----------
-    ds_indices : xr.Dataset
-        Pre-computed indices dataset (1980-2025) with gdd, edd, dry_day, pr
-    coffee_ids : list
-        List of geoid values for coffee regions
+    ds : xr.Dataset
+        Coffee-region mean of the pre-computed indices (1980-2025) with gdd,
+        edd, dry_day, pr
     output_path : Path
         Path to save the output figure
     current_season : str
@@ -1021,9 +1271,6 @@ def plot_dayofyear_indices(
     """
     print("Creating day-of-year indices plot...")
 
-    # Select coffee regions and average
-    ds = ds_indices.sel(geoid=coffee_ids).mean(dim="geoid")
-
     # Define indices to plot with their display configuration
     indices_config = [
         ("gdd", "Growing Degree Days (°C·days)", "cumsum"),
@@ -1035,96 +1282,122 @@ def plot_dayofyear_indices(
     # Filter to only available indices
     indices_config = [(v, l, a) for v, l, a in indices_config if v in ds.data_vars]
 
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), layout="constrained")
     axes = axes.flatten()
 
     # Parse current season years
     current_start_year, _ = map(int, current_season.split("-"))
 
-    for idx, (var, ylabel, agg_type) in enumerate(indices_config):
-        ax = axes[idx]
-
-        # Build dataframe with year and dayofyear
-        df = ds[var].to_dataframe().reset_index()
-        df["date"] = pd.to_datetime(df["time"])
-        df["year"] = df["date"].dt.year
-        df["dayofyear"] = df["date"].dt.dayofyear
-
-        # Define coffee season (Oct-Sep) - assign season year based on Oct start
-        # Season 2024-2025 starts Oct 2024, ends Sep 2025
-        df["season_year"] = df.apply(
-            lambda r: r["year"] if r["date"].month >= 10 else r["year"] - 1, axis=1
+    # All indices share one time axis, so derive the season bookkeeping once.
+    # Define coffee season (Oct-Sep) - assign season year based on Oct start
+    # Season 2024-2025 starts Oct 2024, ends Sep 2025
+    dates = ds.indexes["time"]
+    season_years = np.where(dates.month >= 10, dates.year, dates.year - 1)
+    # Whole days since epoch, so season offsets are plain int64 subtraction
+    days = dates.values.astype("datetime64[D]").view(np.int64)
+
+    # Sort once so each season is a contiguous block of rows
+    order = np.lexsort((days, season_years))
+    season_years = season_years[order]
+    days = days[order]
+
+    # Stack the indices into one contiguous (time, index) float32 array so
+    # each season is accumulated for every index in a single pass
+    vals = np.stack(
+        [ds[var].values for var, _, _ in indices_config], axis=1
+    ).astype(np.float32)[order]
+    is_cumsum = np.array([agg_type == "cumsum" for _, _, agg_type in indices_config])
+
+    # Get unique seasons and the row range each one covers
+    seasons, season_starts = np.unique(season_years, return_index=True)
+    season_ends = np.append(season_starts[1:], len(season_years))
+
+    # Storage for climatology calculation, one list per index
+    all_season_data = [[] for _ in indices_config]
+
+    # Plot each season
+    for season, start, end in zip(seasons, season_starts, season_ends):
+        season_start = np.datetime64(f"{season}-10-01", "D").astype(np.int64)
+
+        # Create season day (1 = Oct 1, etc.)
+        season_day = days[start:end] - season_start + 1
+
+        # Compute cumulative sums, skipping NaNs like pandas cumsum
+        season_values = vals[start:end]
+        cumulative = np.where(
+            is_cumsum, np.nancumsum(season_values, axis=0), season_values
         )
+        cumulative[np.isnan(season_values)] = np.nan
 
-        # Get unique seasons
-        seasons = sorted(df["season_year"].unique())
-
-        # Storage for climatology calculation
-        all_season_data = []
-
-        # Plot each season
-        for season in seasons:
-            # Select data for this season (Oct of season year to Sep of next year)
-            season_start = pd.Timestamp(f"{season}-10-01")
-            season_end = pd.Timestamp(f"{season + 1}-09-30")
-            mask = (df["date"] >= season_start) & (df["date"] <= season_end)
-            season_df = df[mask].copy()
-
-            if len(season_df) == 0:
-                continue
-
-            # Create season day (1 = Oct 1, etc.)
-            season_df["season_day"] = (
-                season_df["date"] - season_start
-            ).dt.days + 1
-
-            # Sort by season day and compute cumulative sum
-            season_df = season_df.sort_values("season_day")
-            if agg_type == "cumsum":
-                season_df["cumulative"] = season_df[var].cumsum()
-            else:
-                season_df["cumulative"] = season_df[var]
-
-            # Check if season is complete (>= 360 valid days)
-            valid_days = season_df["cumulative"].notna().sum()
-            is_complete = valid_days >= 360
+        # Check if season is complete (>= 360 valid days) for each index
+        is_complete = np.count_nonzero(~np.isnan(cumulative), axis=0) >= 360
 
-            # Store for climatology (exclude current season AND incomplete seasons)
-            if season != current_start_year and is_complete:
-                all_season_data.append(season_df[["season_day", "cumulative"]])
+        # Determine styling based on whether this is current season
+        is_current = season == current_start_year
 
-            # Determine styling based on whether this is current season
-            is_current = season == current_start_year
+        for idx, ax in enumerate(axes[: len(indices_config)]):
+            # Store for climatology and the historical lines (exclude current
+            # season AND incomplete seasons)
+            if not is_current and is_complete[idx]:
+                all_season_data[idx].append((season_day, cumulative[:, idx]))
 
             if is_current:
                 ax.plot(
-                    season_df["season_day"],
-                    season_df["cumulative"],
+                    season_day,
+                    cumulative[:, idx],
                     color="C0",
                     linewidth=2,
                     label=f"{season}-{season + 1}",
                     zorder=10,
                 )
-            elif is_complete:
-                # Only plot complete historical seasons
-                ax.plot(
-                    season_df["season_day"],
-                    season_df["cumulative"],
-                    color="grey",
-                    linewidth=0.5,
-                    alpha=0.5,
-                    linestyle="-",
-                    zorder=1,
-                )
 
-        # Compute climatology from historical seasons
-        if all_season_data:
-            clim_df = pd.concat(all_season_data, ignore_index=True)
-            clim_grouped = clim_df.groupby("season_day")["cumulative"]
-            clim_mean = clim_grouped.mean()
-            clim_std = clim_grouped.std()
+    for idx, (var, ylabel, _) in enumerate(indices_config):
+        ax = axes[idx]
 
-            season_days = clim_mean.index
+        # Compute climatology from historical seasons
+        if all_season_data[idx]:
+            # Draw the complete historical seasons as a single collection,
+            # rasterized so the grey background doesn't bloat the output
+            historical = LineCollection(
+                [np.column_stack(season) for season in all_season_data[idx]],
+                colors="grey",
+                linewidths=0.5,
+                alpha=0.5,
+                linestyles="-",
+                zorder=1,
+                rasterized=True,
+            )
+            ax.add_collection(historical)
+            ax.autoscale_view()
+
+            # Copy the historical seasons into preallocated flat arrays
+            total = sum(len(hist_days) for hist_days, _ in all_season_data[idx])
+            clim_days = np.empty(total, dtype=np.int16)
+            clim_values = np.empty(total, dtype=np.float32)
+            offset = 0
+            for hist_days, hist_values in all_season_data[idx]:
+                clim_days[offset : offset + len(hist_days)] = hist_days
+                clim_values[offset : offset + len(hist_days)] = hist_values
+                offset += len(hist_days)
+
+            # Mean and sample std per season day via bincount, skipping NaNs.
+            # Two passes - squared deviations from the mean - avoid the
+            # cancellation of the sum-of-squares form on cumulative totals
+            valid = ~np.isnan(clim_values)
+            days, values = clim_days[valid], clim_values[valid]
+            season_days = np.flatnonzero(np.bincount(clim_days))
+            n_days = season_days[-1] + 1
+            count = np.bincount(days, minlength=n_days)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean = np.bincount(days, weights=values, minlength=n_days) / count
+                sq_dev = np.bincount(
+                    days, weights=np.square(values - mean[days]), minlength=n_days
+                )
+                variance = sq_dev / (count - 1)
+            # A single season gives no spread
+            variance[count < 2] = np.nan
+            clim_mean = mean[season_days]
+            clim_std = np.sqrt(variance[season_days])
 
             # Plot climatology mean line
             ax.plot(
@@ -1145,6 +1418,7 @@ def plot_dayofyear_indices(
                 color="grey",
                 alpha=0.3,
                 zorder=2,
+                rasterized=True,
             )
 
         # Formatting
@@ -1154,17 +1428,12 @@ def plot_dayofyear_indices(
         ax.legend(loc="upper left")
 
         # Add month labels on x-axis
-        month_starts = [1, 32, 62, 93, 124, 152, 183, 213, 244, 274, 305, 335]
-        month_labels = [
-            "Oct", "Nov", "Dec", "Jan", "Feb", "Mar",
-            "Apr", "May", "Jun", "Jul", "Aug", "Sep"
-        ]
-        ax.set_xticks(month_starts)
-        ax.set_xticklabels(month_labels, fontsize=8)
+        ax.set_xticks(MONTH_STARTS)
+        ax.set_xticklabels(MONTH_LABELS, fontsize=8)
         ax.set_xlim(1, 365)
 
-    # Count historical seasons used (from last variable's seasons list)
-    n_historical = len(seasons) - 1 if seasons else 0
+    # Count historical seasons used
+    n_historical = len(seasons) - 1 if len(seasons) else 0
 
     plt.suptitle(
         f"Central Highlands Coffee Regions - Seasonal Index Accumulation\n"
@@ -1172,35 +1441,34 @@ def plot_dayofyear_indices(
         fontsize=14,
         fontweight="bold",
     )
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200, bbox_inches="tight")
+    plt.savefig(output_path, dpi=200)
     plt.close()
     print(f"  Saved: {output_path}")
 
 
 def plot_annual_comparison(
-    ds_agg: xr.Dataset,
-    coffee_ids: list,
+    ds: xr.Dataset,
     output_path: Path,
 ) -> None:
-    """Compare annual precipitation and temperature."""
+    """Compare annual precipitation and temperature of the coffee-region mean."""
     print("Creating annual comparison plot...")
 
-    fig, ax = plt.subplots(figsize=(10, 8))
-
-    # Select coffee regions
-    ds = ds_agg.sel(geoid=coffee_ids).mean(dim="geoid")
+    fig, ax = plt.subplots(figsize=(10, 8), layout="constrained")
 
     # Annual means
-    tas_annual = ds["tas"].resample(time="YE").mean()
-    pr_annual = ds["pr"].resample(time="YE").sum()
+    # Calendar-year groupby indexes the result by integer year directly
+    tas_annual = ds["tas"].groupby("time.year").mean()
+    pr_annual = ds["pr"].groupby("time.year").sum()
 
-    years = pd.to_datetime(tas_annual.time.values).year
+    # Convert to plain arrays once and reuse for scatter, labels and highlights
+    years = tas_annual["year"].values.astype(np.int16)
+    pr_values = pr_annual.values
+    tas_values = tas_annual.values
 
     # Scatter plot with year labels
     scatter = ax.scatter(
-        pr_annual.values,
-        tas_annual.values,
+        pr_values,
+        tas_values,
         c=years,
         cmap="viridis",
         s=100,
@@ -1209,20 +1477,20 @@ def plot_annual_comparison(
     )
 
     # Add year labels
-    for i, year in enumerate(years):
+    for x, y, text in zip(pr_values, tas_values, years.astype(str)):
         ax.annotate(
-            str(year),
-            (pr_annual.values[i], tas_annual.values[i]),
+            text,
+            (x, y),
             textcoords="offset points",
             xytext=(5, 5),
             fontsize=8,
         )
 
     # Highlight recent years
-    recent_mask = years >= 2020
+    recent_idx = np.flatnonzero(years >= 2020)
     ax.scatter(
-        pr_annual.values[recent_mask],
-        tas_annual.values[recent_mask],
+        pr_values[recent_idx],
+        tas_values[recent_idx],
         facecolors="none",
         edgecolors=COLOURS["anomaly_pos"],
         s=150,
@@ -1236,8 +1504,7 @@ def plot_annual_comparison(
     ax.legend()
 
     plt.colorbar(scatter, ax=ax, label="Year")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=200, bbox_inches="tight")
+    plt.savefig(output_path, dpi=200)
     plt.close()
     print(f"  Saved: {output_path}")
 
@@ -1253,9 +1520,14 @@ def main() -> None:
 
     # Load data
     print("\nLoading data...")
-    ds_agg = xr.open_zarr(AGG_PATH)
-    gdf = gpd.read_parquet(BOUNDS_PATH)
-    gdf_adm0 = gpd.read_parquet(BOUNDS_ADM0_PATH)
+    # chunks={} keeps each store's own zarr chunking, so the positional geoid
+    # selection below maps directly onto the chunks that have to be read
+    ds_agg = xr.open_zarr(AGG_PATH, chunks={})
+    # Only the id, name and outline columns are used - skip any other attributes
+    gdf = gpd.read_parquet(BOUNDS_PATH, columns=["geoid", "geoname", "geometry"])
+    gdf_adm0 = gpd.read_parquet(BOUNDS_ADM0_PATH, columns=["geometry"])
+    # Dissolve the country outline once; the hi-res mask is built from it
+    adm0_union = gdf_adm0.union_all()
 
     # Get coffee region IDs
     coffee_ids = get_coffee_region_ids(ds_agg, gdf)
@@ -1265,101 +1537,210 @@ def main() -> None:
         print("WARNING: No coffee regions found, using all regions")
         coffee_ids = list(ds_agg.geoid.values)
 
-    # Create coffee regions map (00)
-    plot_coffee_regions_map(
-        gdf_adm0,
-        gdf,
-        coffee_ids,
-        OUTPUT_DIR / "00_coffee_regions_map.png",
-    )
-
-    # Create gridded weather map (01b)
-    if RAW_GRID_PATH.exists():
-        ds_grid = xr.open_zarr(RAW_GRID_PATH)
-        plot_gridded_weather_map(
-            ds_grid,
-            gdf_adm0,
-            gdf,
-            OUTPUT_DIR / "01b_gridded_weather_map.png",
-            date="2024-03-15",  # El Niño peak date
+    # Subset every available store lazily to the variables and regions used by
+    # the plots, then load them concurrently in the background - the reads are
+    # independent and I/O bound, and overlap with the map rendering below.
+    # Everything except the climatology (queried per geoid) is reduced to the
+    # coffee-region mean before loading.
+    lazy_datasets = {
+        AGG_PATH: coffee_mean(ds_agg, ["tas", "pr"], coffee_ids),
+    }
+    if CLIM_PATH.exists():
+        lazy_datasets[CLIM_PATH] = select_geoids(
+            xr.open_zarr(CLIM_PATH, chunks={}), coffee_ids
         )
-        # Create high-resolution version (01c)
-        plot_gridded_weather_map_highres(
-            ds_grid,
-            gdf_adm0,
-            gdf,
-            OUTPUT_DIR / "01c_gridded_weather_map_highres.png",
-            date="2024-03-15",
-            target_res_km=5.0,  # ~5km resolution (1km would be very slow)
+    if ANOMALIES_PATH.exists():
+        lazy_datasets[ANOMALIES_PATH] = coffee_mean(
+            xr.open_zarr(ANOMALIES_PATH, chunks={}), ["tas", "pr"], coffee_ids
         )
-    else:
-        print(f"Skipping gridded map - raw data not found at {RAW_GRID_PATH}")
-
-    # Load all datasets
-    ds_agg = ds_agg.load()
-
-    # Create time series plot
-    if CLIM_PATH.exists():
-        ds_clim = xr.open_zarr(CLIM_PATH).load()
-
-        # Load trend parameters for retrending (converts detrended temps back to original)
-        polys, transforms = None, None
-        if TREND_PATH.exists():
-            print(f"Loading trend parameters from: {TREND_PATH}")
-            polys, transforms = load_trend_params(TREND_PATH)
-
-        plot_time_series_with_climatology(
-            ds_agg,
-            ds_clim,
+    if INDICES_PATH.exists():
+        lazy_datasets[INDICES_PATH] = coffee_mean(
+            xr.open_zarr(INDICES_PATH, chunks={}),
+            ["gdd", "edd", "dry_day", "swvl_mean"],
             coffee_ids,
-            OUTPUT_DIR / "02_time_series_vs_climatology.png",
-            polys=polys,
-            transforms=transforms,
         )
-        # Minimal version without titles and x-tick labels
-        plot_time_series_with_climatology_minimal(
-            ds_agg,
-            ds_clim,
+    if INDICES_FULL_PATH.exists():
+        lazy_datasets[INDICES_FULL_PATH] = coffee_mean(
+            xr.open_zarr(INDICES_FULL_PATH, chunks={}),
+            ["gdd", "edd", "dry_day", "pr"],
             coffee_ids,
-            OUTPUT_DIR / "02b_time_series_minimal.png",
-            polys=polys,
-            transforms=transforms,
         )
-    else:
-        print(f"Skipping time series plot - climatology not found at {CLIM_PATH}")
 
-    # Create anomaly plot
-    if ANOMALIES_PATH.exists():
-        ds_anomalies = xr.open_zarr(ANOMALIES_PATH).load()
-        plot_monthly_anomalies(
-            ds_anomalies, coffee_ids, OUTPUT_DIR / "03_monthly_anomalies.png"
-        )
-    else:
-        print(f"Skipping anomaly plot - anomalies not found at {ANOMALIES_PATH}")
+    # Every figure is independent once its inputs are in memory, and saving
+    # is CPU bound, so render them in worker processes - one per figure at
+    # most. Spawned workers re-import this module, which selects the Agg
+    # backend. The with-blocks release both pools if anything below raises.
+    n_figures = (
+        2  # coffee regions map and annual comparison
+        + 2 * RAW_GRID_PATH.exists()
+        + 2 * (CLIM_PATH in lazy_datasets)
+        + (ANOMALIES_PATH in lazy_datasets)
+        + (INDICES_PATH in lazy_datasets)
+        + (INDICES_FULL_PATH in lazy_datasets)
+    )
+    with (
+        ThreadPoolExecutor(max_workers=len(lazy_datasets)) as executor,
+        multiprocessing.get_context("spawn").Pool(
+            min(n_figures, os.cpu_count())
+        ) as pool,
+    ):
+        futures = {
+            path: executor.submit(ds.load) for path, ds in lazy_datasets.items()
+        }
 
-    # Create index dashboard
-    if INDICES_PATH.exists():
-        ds_indices = xr.open_zarr(INDICES_PATH).load()
-        plot_index_dashboard(
-            ds_indices, coffee_ids, OUTPUT_DIR / "04_index_dashboard.png"
+        results = []
+
+        # Create coffee regions map (00)
+        results.append(
+            pool.apply_async(
+                plot_coffee_regions_map,
+                (gdf_adm0, gdf, coffee_ids, OUTPUT_DIR / "00_coffee_regions_map.png"),
+            )
         )
-    else:
-        print(f"Skipping index dashboard - indices not found at {INDICES_PATH}")
 
-    # Create day-of-year seasonal indices plot (uses full 1980-2025 indices)
-    if INDICES_FULL_PATH.exists():
-        ds_indices_full = xr.open_zarr(INDICES_FULL_PATH).load()
-        plot_dayofyear_indices(
-            ds_indices_full,
-            coffee_ids,
-            OUTPUT_DIR / "07_dayofyear_indices.png",
-            current_season="2024-2025",
+        # Create gridded weather map (01b)
+        if RAW_GRID_PATH.exists():
+            # Only one time step is ever plotted - read it from a cached snapshot
+            ds_grid = grid_snapshot(RAW_GRID_PATH, "2024-03-15")
+            results.append(
+                pool.apply_async(
+                    plot_gridded_weather_map,
+                    (
+                        ds_grid,
+                        gdf_adm0,
+                        gdf,
+                        OUTPUT_DIR / "01b_gridded_weather_map.png",
+                    ),
+                    {"date": "2024-03-15"},  # El Niño peak date
+                )
+            )
+            # Create high-resolution version (01c)
+            results.append(
+                pool.apply_async(
+                    plot_gridded_weather_map_highres,
+                    (
+                        ds_grid,
+                        gdf_adm0,
+                        gdf,
+                        OUTPUT_DIR / "01c_gridded_weather_map_highres.png",
+                    ),
+                    {
+                        "date": "2024-03-15",
+                        "target_res_km": 5.0,  # ~5km resolution (1km would be very slow)
+                        "adm0_union": adm0_union,
+                    },
+                )
+            )
+        else:
+            print(f"Skipping gridded map - raw data not found at {RAW_GRID_PATH}")
+
+        # Wait for the background loads
+        datasets = {path: future.result() for path, future in futures.items()}
+        ds_agg_coffee = datasets[AGG_PATH]
+
+        # Create time series plot
+        if CLIM_PATH in datasets:
+            ds_clim = datasets[CLIM_PATH]
+
+            # Load trend parameters for retrending (converts detrended temps back to original)
+            polys, transforms = None, None
+            if TREND_PATH.exists():
+                print(f"Loading trend parameters from: {TREND_PATH}")
+                polys, transforms = load_trend_params(TREND_PATH)
+
+            # Both time series plots query the same climatology - run the query
+            # here so the two workers read it from the disk cache rather than
+            # racing to compute and write it
+            time = ds_agg_coffee.sel(time=slice("2020-01-01", "2025-12-31")).indexes[
+                "time"
+            ]
+            coffee_climatology(ds_clim, coffee_ids, time, polys, transforms)
+
+            trend_kwargs = {"polys": polys, "transforms": transforms}
+            results.append(
+                pool.apply_async(
+                    plot_time_series_with_climatology,
+                    (
+                        ds_agg_coffee,
+                        ds_clim,
+                        coffee_ids,
+                        OUTPUT_DIR / f"02_time_series_vs_climatology.{CHART_FORMAT}",
+                    ),
+                    trend_kwargs,
+                )
+            )
+            # Minimal version without titles and x-tick labels
+            results.append(
+                pool.apply_async(
+                    plot_time_series_with_climatology_minimal,
+                    (
+                        ds_agg_coffee,
+                        ds_clim,
+                        coffee_ids,
+                        OUTPUT_DIR / f"02b_time_series_minimal.{CHART_FORMAT}",
+                    ),
+                    trend_kwargs,
+                )
+            )
+        else:
+            print(f"Skipping time series plot - climatology not found at {CLIM_PATH}")
+
+        # Create anomaly plot
+        if ANOMALIES_PATH in datasets:
+            results.append(
+                pool.apply_async(
+                    plot_monthly_anomalies,
+                    (datasets[ANOMALIES_PATH], OUTPUT_DIR / "03_monthly_anomalies.png"),
+                )
+            )
+        else:
+            print(f"Skipping anomaly plot - anomalies not found at {ANOMALIES_PATH}")
+
+        # Create index dashboard
+        if INDICES_PATH in datasets:
+            results.append(
+                pool.apply_async(
+                    plot_index_dashboard,
+                    (
+                        datasets[INDICES_PATH],
+                        OUTPUT_DIR / f"04_index_dashboard.{CHART_FORMAT}",
+                    ),
+                )
+            )
+        else:
+            print(f"Skipping index dashboard - indices not found at {INDICES_PATH}")
+
+        # Create day-of-year seasonal indices plot (uses full 1980-2025 indices)
+        if INDICES_FULL_PATH in datasets:
+            # float32 is ample for cumulative sums plotted at 200 dpi and halves
+            # the memory moved through the per-season accumulation
+            ds_indices_full = datasets[INDICES_FULL_PATH].astype(np.float32)
+            results.append(
+                pool.apply_async(
+                    plot_dayofyear_indices,
+                    (
+                        ds_indices_full,
+                        OUTPUT_DIR / f"07_dayofyear_indices.{CHART_FORMAT}",
+                    ),
+                    {"current_season": "2024-2025"},
+                )
+            )
+        else:
+            print(f"Skipping day-of-year plot - full indices not found at {INDICES_FULL_PATH}")
+
+        # Create annual comparison
+        results.append(
+            pool.apply_async(
+                plot_annual_comparison,
+                (ds_agg_coffee, OUTPUT_DIR / f"05_annual_comparison.{CHART_FORMAT}"),
+            )
         )
-    else:
-        print(f"Skipping day-of-year plot - full indices not found at {INDICES_FULL_PATH}")
 
-    # Create annual comparison
-    plot_annual_comparison(ds_agg, coffee_ids, OUTPUT_DIR / "05_annual_comparison.png")
+        # Wait for every figure, re-raising any error from the workers
+        pool.close()
+        for result in results:
+            result.get()
+        pool.join()
 
     print("\n" + "=" * 60)
     print("VISUALISATION COMPLETE")
@@ -7,35 +7,80 @@ to highlight areas with high coffee probability.
 
 from pathlib import Path
 
+import matplotlib
+
+# Batch script that only writes files - select the non-interactive backend
+# before pyplot is imported
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
 import rasterio
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import LinearSegmentedColormap, ListedColormap, Normalize
+from rasterio.enums import Resampling
 
+# Largest raster (rows, cols) worth drawing: twice the pixels of the
+# 10x12 inch map at 150 dpi. Bigger rasters are averaged down on read.
+MAX_RASTER_SHAPE = (2 * 12 * 150, 2 * 10 * 150)
 
-def create_coffee_probability_map(
-    tif_path: Path,
-    output_path: Path,
-    title: str = "Vietnam Coffee Growing Regions",
-) -> None:
+
+def _load_clipped(
+    tif_path: Path, max_shape: tuple[int, int] = MAX_RASTER_SHAPE
+) -> tuple[np.ndarray, list[float]]:
     """
-    Create a map showing coffee probability in Vietnam.
+    Read the coffee probability raster once, cleaned for plotting.
 
-    Uses a green colour palette where darker green indicates
-    higher probability of coffee cultivation.
+    Rasters larger than ``max_shape`` are read decimated with average
+    resampling (preserving mean probability), since imshow would only
+    resample the extra pixels away.
+
+    Returns the band clipped to the valid probability range and quantised
+    to uint8 colormap bins (0-255), plus its extent as
+    [left, right, bottom, top] for imshow.
     """
     with rasterio.open(tif_path) as src:
-        data = src.read(1)
+        scale = max(1.0, src.height / max_shape[0], src.width / max_shape[1])
+        out_shape = (round(src.height / scale), round(src.width / scale))
+        # float32 is ample for a probability and fixes the dtype we clean in place
+        data = src.read(
+            1,
+            out=np.empty(out_shape, dtype=np.float32),
+            resampling=Resampling.average,
+        )
         bounds = src.bounds
 
-    # Replace -inf/nan with 0 for visualisation
-    data = np.where(np.isfinite(data), data, 0)
+    # Replace -inf/nan (and +inf) with 0 for visualisation, in place
+    np.nan_to_num(data, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+    # Quantise to the 256 colormap bins imshow would use anyway, so the
+    # image path resamples one byte per pixel instead of four. Scaling
+    # first lets a single clip both bound the probability to [0, 1] and
+    # cast to uint8 in one pass
+    np.multiply(data, 256, out=data)
+    data = np.clip(
+        data, 0, 255, out=np.empty(data.shape, dtype=np.uint8), casting="unsafe"
+    )
+
+    extent = [bounds.left, bounds.right, bounds.bottom, bounds.top]
+    return data, extent
+
+
+def _lut_cmap(name: str, colors: list[str]) -> ListedColormap:
+    """
+    Build a 256-entry lookup-table colormap interpolated between colors.
+
+    Matches the uint8 bins from _load_clipped one-to-one, so colour
+    mapping is a single table lookup per pixel.
+    """
+    lut = LinearSegmentedColormap.from_list(name, colors)(np.linspace(0, 1, 256))
+    return ListedColormap(lut, name=name)
 
-    # Clip to valid probability range
-    data = np.clip(data, 0, 1)
 
-    # Create custom green colormap (white to dark green)
-    colors = [
+# Custom green colormap (white to dark green), built once at import
+_LIGHT_CMAP = _lut_cmap(
+    "coffee_green",
+    [
         "#f7fcf5",  # Very light green (almost white) - no coffee
         "#e5f5e0",
         "#c7e9c0",
@@ -45,25 +90,85 @@ def create_coffee_probability_map(
         "#238b45",
         "#006d2c",
         "#00441b",  # Dark green - high probability
-    ]
-    green_cmap = LinearSegmentedColormap.from_list("coffee_green", colors)
+    ],
+)
 
-    # Create figure
-    fig, ax = plt.subplots(figsize=(10, 12), facecolor="white")
+# Dark theme green colormap
+_DARK_CMAP = _lut_cmap(
+    "coffee_green_dark",
+    [
+        "#1a1a1a",  # Dark background - no coffee
+        "#0d2818",
+        "#1a4024",
+        "#265930",
+        "#32723c",
+        "#3e8c48",
+        "#4aa654",
+        "#56c060",
+        "#62da6c",  # Bright green - high probability
+    ],
+)
 
-    # Plot the raster
-    extent = [bounds.left, bounds.right, bounds.bottom, bounds.top]
-    im = ax.imshow(
+
+def _geo_aspect(extent: list[float]) -> float:
+    """
+    Axes aspect for a lon/lat raster: one degree of longitude drawn
+    cos(mid-latitude) as long as a degree of latitude.
+    """
+    lat_mid = 0.5 * (extent[2] + extent[3])
+    return 1.0 / np.cos(np.deg2rad(lat_mid))
+
+
+def _reset_figure(fig: plt.Figure | None, facecolor: str) -> plt.Axes:
+    """
+    Return a fresh single axes on ``fig`` (cleared first), or on a new
+    10x12 inch figure when ``fig`` is None.
+    """
+    if fig is None:
+        fig = plt.figure(figsize=(10, 12))
+    else:
+        fig.clear()
+    fig.set_facecolor(facecolor)
+    return fig.add_subplot()
+
+
+def create_coffee_probability_map(
+    data: np.ndarray,
+    extent: list[float],
+    output_path: Path,
+    title: str = "Vietnam Coffee Growing Regions",
+    fig: plt.Figure | None = None,
+) -> None:
+    """
+    Create a map showing coffee probability in Vietnam.
+
+    Uses a green colour palette where darker green indicates
+    higher probability of coffee cultivation. Takes the cleaned
+    raster and extent from _load_clipped. Pass ``fig`` to clear and
+    redraw an existing figure instead of building a new one.
+    """
+    # Create (or clear) the figure
+    ax = _reset_figure(fig, facecolor="white")
+
+    # Plot the raster; rasterized so vector outputs embed it as one image
+    ax.imshow(
         data,
         extent=extent,
         origin="upper",
-        cmap=green_cmap,
+        cmap=_LIGHT_CMAP,
         vmin=0,
-        vmax=1,
+        vmax=255,
+        aspect=_geo_aspect(extent),
+        rasterized=True,
     )
 
-    # Add colourbar
-    cbar = plt.colorbar(im, ax=ax, shrink=0.6, label="Coffee Probability")
+    # Add colourbar on the 0-1 probability scale rather than the byte values
+    cbar = ax.figure.colorbar(
+        ScalarMappable(norm=Normalize(vmin=0, vmax=1), cmap=_LIGHT_CMAP),
+        ax=ax,
+        shrink=0.6,
+        label="Coffee Probability",
+    )
     cbar.ax.tick_params(labelsize=10)
 
     # Styling
@@ -74,63 +179,56 @@ def create_coffee_probability_map(
     # Add grid
     ax.grid(True, alpha=0.3, linestyle="--", color="gray")
 
-    # Set aspect ratio to equal for geographic accuracy
-    ax.set_aspect("equal")
-
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, facecolor="white", bbox_inches="tight")
-    plt.close()
+    ax.figure.tight_layout()
+    # zlib level 3 writes several times faster for a slightly larger file
+    ax.figure.savefig(
+        output_path,
+        dpi=150,
+        facecolor="white",
+        bbox_inches="tight",
+        pil_kwargs={"compress_level": 3, "optimize": False},
+    )
+    if fig is None:
+        plt.close(ax.figure)
 
     print(f"Saved coffee probability map to: {output_path}")
 
 
 def create_coffee_probability_map_dark(
-    tif_path: Path,
+    data: np.ndarray,
+    extent: list[float],
     output_path: Path,
     title: str = "Vietnam Coffee Growing Regions",
+    fig: plt.Figure | None = None,
 ) -> None:
     """
     Create a dark-themed map matching the booth aesthetic.
-    """
-    with rasterio.open(tif_path) as src:
-        data = src.read(1)
-        bounds = src.bounds
 
-    # Replace -inf/nan with 0
-    data = np.where(np.isfinite(data), data, 0)
-    data = np.clip(data, 0, 1)
-
-    # Dark theme green colormap
-    colors = [
-        "#1a1a1a",  # Dark background - no coffee
-        "#0d2818",
-        "#1a4024",
-        "#265930",
-        "#32723c",
-        "#3e8c48",
-        "#4aa654",
-        "#56c060",
-        "#62da6c",  # Bright green - high probability
-    ]
-    green_cmap = LinearSegmentedColormap.from_list("coffee_green_dark", colors)
-
-    # Create figure with dark background
-    fig, ax = plt.subplots(figsize=(10, 12), facecolor="#1a1a1a")
+    Pass ``fig`` to clear and redraw an existing figure.
+    """
+    # Create (or clear) the figure with dark background
+    ax = _reset_figure(fig, facecolor="#1a1a1a")
     ax.set_facecolor("#1a1a1a")
 
     # Plot the raster
-    extent = [bounds.left, bounds.right, bounds.bottom, bounds.top]
-    im = ax.imshow(
+    ax.imshow(
         data,
         extent=extent,
         origin="upper",
-        cmap=green_cmap,
+        cmap=_DARK_CMAP,
         vmin=0,
-        vmax=1,
+        vmax=255,
+        aspect=_geo_aspect(extent),
+        rasterized=True,
     )
 
-    # Add colourbar
-    cbar = plt.colorbar(im, ax=ax, shrink=0.6, label="Coffee Probability")
+    # Add colourbar on the 0-1 probability scale rather than the byte values
+    cbar = ax.figure.colorbar(
+        ScalarMappable(norm=Normalize(vmin=0, vmax=1), cmap=_DARK_CMAP),
+        ax=ax,
+        shrink=0.6,
+        label="Coffee Probability",
+    )
     cbar.ax.yaxis.set_tick_params(color="white")
     cbar.ax.yaxis.label.set_color("white")
     cbar.outline.set_edgecolor("white")
@@ -150,11 +248,16 @@ def create_coffee_probability_map_dark(
         spine.set_color("white")
         spine.set_alpha(0.3)
 
-    ax.set_aspect("equal")
-
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, facecolor="#1a1a1a", bbox_inches="tight")
-    plt.close()
+    ax.figure.tight_layout()
+    ax.figure.savefig(
+        output_path,
+        dpi=150,
+        facecolor="#1a1a1a",
+        bbox_inches="tight",
+        pil_kwargs={"compress_level": 3, "optimize": False},
+    )
+    if fig is None:
+        plt.close(ax.figure)
 
     print(f"Saved dark-themed coffee probability map to: {output_path}")
 
@@ -165,20 +268,27 @@ def main() -> None:
     output_dir = Path(__file__).parent.parent / "outputs"
     output_dir.mkdir(exist_ok=True)
 
-    tif_path = data_dir / "vietnam_coffee_probability.tif"
+    # Read and clean the raster once for both maps
+    data, extent = _load_clipped(data_dir / "vietnam_coffee_probability.tif")
 
-    # Create both light and dark themed maps
+    # Create both light and dark themed maps, redrawing one figure
+    fig = plt.figure(figsize=(10, 12))
     create_coffee_probability_map(
-        tif_path,
+        data,
+        extent,
         output_dir / "vietnam_coffee_map.png",
         title="Vietnam Coffee Growing Regions",
+        fig=fig,
     )
 
     create_coffee_probability_map_dark(
-        tif_path,
+        data,
+        extent,
         output_dir / "vietnam_coffee_map_dark.png",
         title="Vietnam Coffee Growing Regions",
+        fig=fig,
     )
+    plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -15,16 +15,37 @@ Together these 5 provinces account for ~92% of Vietnam's coffee cultivation area
 and ~90% of national output.
 """
 
+import multiprocessing
+import os
+
 import geopandas as gpd
-import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.patheffects as pe
+import numpy as np
+import pandas as pd
+import shapely
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import LinearSegmentedColormap, Normalize
+from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
 from pathlib import Path
 
 # Configuration
 OUTPUT_DIR = Path("/Users/tommylees/github/vietnam_coffee_synthetic/artefacts")
 OUTPUT_DIR.mkdir(exist_ok=True)
+CACHE_DIR = OUTPUT_DIR / ".cache"
+BOUNDARIES_PATH = Path(
+    "/Users/tommylees/data/raw/boundaries/all_geoboundaries_processed.parquet"
+)
+
+# Outline simplification for the country-scale maps (degrees). The overview
+# spends about 0.004 degrees per pixel at 300 dpi, so this stays sub-pixel
+SIMPLIFY_TOLERANCE_DEG = 0.002
+
+# File format for every figure. "pdf" keeps text, legends and axes vector
+# while the rasterized province layers are embedded at the 300 dpi below
+FIGURE_FORMAT = "png"
 
 # Colour palette - professional, print-ready
 COLOURS = {
@@ -39,6 +60,14 @@ COLOURS = {
     "background": "#FAFAFA",  # Off-white background
 }
 
+# Black outline behind the white province labels, shared by every label
+LABEL_STROKE = [pe.withStroke(linewidth=2, foreground="black")]
+
+# Production share colourbar, secondary green up to Dak Lak's darkest
+COFFEE_CMAP = LinearSegmentedColormap.from_list(
+    "coffee", [COLOURS["coffee_secondary"], COLOURS["dak_lak"]]
+)
+
 # Coffee province production data (2025 estimates)
 COFFEE_DATA = {
     "gia lai": {"production_pct": 18, "area_ha": 98000, "yield_kg_ha": 2750},
@@ -48,6 +77,28 @@ COFFEE_DATA = {
     "??k nong": {"production_pct": 12, "area_ha": 136000, "yield_kg_ha": 2700},
 }
 
+# Central Highlands coffee provinces (geoname patterns)
+CENTRAL_HIGHLANDS = frozenset(["gia lai", "kon tum", "lam ??ng", "??k l?k", "??k nong"])
+# Northern arabica province
+NORTHERN_ARABICA = frozenset(["s?n la"])
+COFFEE_PROVINCES = CENTRAL_HIGHLANDS | NORTHERN_ARABICA
+
+# Yield history and forecast (kg/ha); 2025 is the current season
+YIELD_YEARS = [2020, 2021, 2022, 2023, 2024, 2025, 2026, 2027]
+YIELD_KG_HA = [2800, 2850, 2980, 2680, 2500, 2650, 2850, 2950]
+
+# Province breakdown for the bar chart and infographic pie, largest first,
+# with gradient colours from darkest green
+PROVINCE_PRODUCTION = pd.DataFrame(
+    {
+        "province": ["Đắk Lắk", "Lâm Đồng", "Gia Lai", "Đắk Nông", "Kon Tum"],
+        "production_pct": [35, 22, 18, 12, 8],
+        "area_ha": [210000, 176000, 98000, 136000, 26000],
+        "yield_kg_ha": [2850, 2900, 2750, 2700, 2600],
+        "colour": ["#1B3D0F", "#2D5016", "#3D6A1E", "#4A7C23", "#5A8F2E"],
+    }
+)
+
 # Clean province name mapping
 PROVINCE_DISPLAY_NAMES = {
     "gia lai": "Gia Lai",
@@ -60,38 +111,65 @@ PROVINCE_DISPLAY_NAMES = {
 
 
 def load_vietnam_boundaries():
-    """Load Vietnam administrative boundaries from geoboundaries."""
-    gdf = gpd.read_parquet(
-        "/Users/tommylees/data/raw/boundaries/all_geoboundaries_processed.parquet"
-    )
-    vnm = gdf[gdf["shapegroup"] == "VNM"].copy()
+    """
+    Load Vietnam administrative boundaries from geoboundaries.
+
+    The first call filters the global file to Vietnam (pushed down into the
+    parquet scan) and writes the result to the cache directory; later calls
+    read that small file instead. It is rebuilt whenever the global file
+    is newer.
+    """
+    path = CACHE_DIR / "vnm_boundaries.parquet"
+    if path.exists() and path.stat().st_mtime >= BOUNDARIES_PATH.stat().st_mtime:
+        return gpd.read_parquet(path)
+
+    vnm = gpd.read_parquet(BOUNDARIES_PATH, filters=[("shapegroup", "==", "VNM")])
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    vnm.to_parquet(path, compression="zstd")
     return vnm
 
 
 def identify_coffee_provinces(adm1_gdf):
     """Identify coffee-growing provinces in the Central Highlands."""
-    # Central Highlands coffee provinces (geoname patterns)
-    central_highlands = ["gia lai", "kon tum", "lam ??ng", "??k l?k", "??k nong"]
-    # Northern arabica province
-    northern_arabica = ["s?n la"]
-
-    adm1_gdf["is_coffee_central"] = adm1_gdf["geoname"].isin(central_highlands)
-    adm1_gdf["is_coffee_northern"] = adm1_gdf["geoname"].isin(northern_arabica)
-    adm1_gdf["is_coffee"] = (
-        adm1_gdf["is_coffee_central"] | adm1_gdf["is_coffee_northern"]
-    )
+    adm1_gdf["is_coffee"] = adm1_gdf["geoname"].isin(COFFEE_PROVINCES)
     adm1_gdf["is_dak_lak"] = adm1_gdf["geoname"] == "??k l?k"
 
     return adm1_gdf
 
 
-def create_vietnam_overview_map(vnm_gdf):
-    """Create an overview map of Vietnam highlighting coffee regions."""
-    adm0 = vnm_gdf[vnm_gdf["shapetype"] == "ADM0"]
-    adm1 = vnm_gdf[vnm_gdf["shapetype"] == "ADM1"].copy()
-    adm1 = identify_coffee_provinces(adm1)
+def _new_figure(**kwargs):
+    """
+    Create a Figure on an Agg canvas, outside pyplot's global figure
+    registry, so nothing needs closing and workers share no pyplot state.
+    """
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _label_coords(gdf):
+    """
+    Label anchor (x, y) rows for each geometry, in one vectorised call.
+
+    Uses a point guaranteed to lie inside each polygon, since the centroid
+    of a concave or multipart province can fall outside it.
+    """
+    return shapely.get_coordinates(shapely.point_on_surface(gdf.geometry.to_numpy()))
 
-    fig, ax = plt.subplots(1, 1, figsize=(10, 14), facecolor=COLOURS["background"])
+
+def create_vietnam_overview_map(adm0, adm1):
+    """
+    Create an overview map of Vietnam highlighting coffee regions.
+
+    Takes the ADM0 outline and the ADM1 provinces already flagged by
+    identify_coffee_provinces.
+    """
+
+    fig = _new_figure(
+        figsize=(10, 14), facecolor=COLOURS["background"], layout="constrained"
+    )
+    ax = fig.add_subplot()
     ax.set_facecolor(COLOURS["water"])
 
     # Plot all provinces first (base layer)
@@ -101,6 +179,7 @@ def create_vietnam_overview_map(vnm_gdf):
         color=COLOURS["vietnam_base"],
         edgecolor=COLOURS["border"],
         linewidth=0.3,
+        rasterized=True,
     )
 
     # Plot coffee provinces (excluding Dak Lak)
@@ -110,28 +189,33 @@ def create_vietnam_overview_map(vnm_gdf):
         color=COLOURS["coffee_primary"],
         edgecolor=COLOURS["border"],
         linewidth=0.5,
+        rasterized=True,
     )
 
     # Plot Dak Lak separately (largest producer)
     dak_lak = adm1[adm1["is_dak_lak"]]
     dak_lak.plot(
-        ax=ax, color=COLOURS["dak_lak"], edgecolor=COLOURS["border"], linewidth=0.5
+        ax=ax,
+        color=COLOURS["dak_lak"],
+        edgecolor=COLOURS["border"],
+        linewidth=0.5,
+        rasterized=True,
     )
 
     # Add province labels for coffee regions
     coffee_provinces = adm1[adm1["is_coffee"]]
-    for idx, row in coffee_provinces.iterrows():
-        centroid = row.geometry.centroid
-        display_name = PROVINCE_DISPLAY_NAMES.get(row["geoname"], row["geoname"])
+    anchors = _label_coords(coffee_provinces)
+    for geoname, (x, y) in zip(coffee_provinces["geoname"], anchors):
+        display_name = PROVINCE_DISPLAY_NAMES.get(geoname, geoname)
         ax.annotate(
             display_name,
-            xy=(centroid.x, centroid.y),
+            xy=(x, y),
             ha="center",
             va="center",
             fontsize=8,
             fontweight="bold",
             color="white",
-            path_effects=[pe.withStroke(linewidth=2, foreground="black")],
+            path_effects=LABEL_STROKE,
         )
 
     # Add major cities
@@ -225,24 +309,23 @@ def create_vietnam_overview_map(vnm_gdf):
     ax.set_xlim(bounds[0] - 0.5, bounds[2] + 0.5)
     ax.set_ylim(bounds[1] - 0.5, bounds[3] + 0.5)
 
-    plt.tight_layout()
-    output_path = OUTPUT_DIR / "vietnam_coffee_overview.png"
-    plt.savefig(
+    output_path = OUTPUT_DIR / f"vietnam_coffee_overview.{FIGURE_FORMAT}"
+    fig.savefig(
         output_path, dpi=300, bbox_inches="tight", facecolor=COLOURS["background"]
     )
-    plt.close()
     print(f"Saved: {output_path}")
     return output_path
 
 
-def create_central_highlands_detail_map(vnm_gdf):
-    """Create a detailed map of the Central Highlands coffee region."""
-    adm1 = vnm_gdf[vnm_gdf["shapetype"] == "ADM1"].copy()
-    adm1 = identify_coffee_provinces(adm1)
+def create_central_highlands_detail_map(adm1):
+    """
+    Create a detailed map of the Central Highlands coffee region.
+
+    Takes the ADM1 provinces already flagged by identify_coffee_provinces.
+    """
 
     # Get Central Highlands provinces and neighbours
-    central_highlands_names = ["gia lai", "kon tum", "lam ??ng", "??k l?k", "??k nong"]
-    central_highlands = adm1[adm1["geoname"].isin(central_highlands_names)]
+    central_highlands = adm1[adm1["geoname"].isin(CENTRAL_HIGHLANDS)]
 
     # Get bounding box of Central Highlands and expand
     bounds = central_highlands.total_bounds
@@ -250,10 +333,17 @@ def create_central_highlands_detail_map(vnm_gdf):
     xlim = (bounds[0] - buffer, bounds[2] + buffer)
     ylim = (bounds[1] - buffer, bounds[3] + buffer)
 
-    # Filter to provinces in view
-    adm1_filtered = adm1.cx[xlim[0] : xlim[1], ylim[0] : ylim[1]]
+    # Filter to provinces in view via the spatial index (sorted to keep
+    # the frame's drawing order)
+    in_view = adm1.sindex.query(
+        shapely.box(xlim[0], ylim[0], xlim[1], ylim[1]), predicate="intersects"
+    )
+    adm1_filtered = adm1.iloc[np.sort(in_view)]
 
-    fig, ax = plt.subplots(1, 1, figsize=(12, 10), facecolor=COLOURS["background"])
+    fig = _new_figure(
+        figsize=(12, 10), facecolor=COLOURS["background"], layout="constrained"
+    )
+    ax = fig.add_subplot()
     ax.set_facecolor(COLOURS["water"])
 
     # Plot non-coffee provinces in view
@@ -263,47 +353,56 @@ def create_central_highlands_detail_map(vnm_gdf):
         color=COLOURS["vietnam_base"],
         edgecolor=COLOURS["border"],
         linewidth=0.5,
+        rasterized=True,
+    )
+
+    # Interpolate a green shade per province from its production share,
+    # vectorised over the provinces
+    pct = central_highlands["geoname"].map(
+        {name: data["production_pct"] for name, data in COFFEE_DATA.items()}
+    )
+    intensity = pct.fillna(0).to_numpy(dtype=float) / 35  # Normalise to max (Dak Lak)
+    rgb = np.column_stack(
+        [
+            45 * (1 - intensity * 0.6),
+            124 * (0.4 + intensity * 0.6),
+            35 * (1 - intensity * 0.6),
+        ]
+    ).astype(int)
+    hex_rgb = np.char.zfill(np.char.mod("%x", rgb), 2)
+    fills = np.char.add(np.char.add(np.char.add("#", hex_rgb[:, 0]), hex_rgb[:, 1]), hex_rgb[:, 2])
+    # Provinces without production data keep the primary coffee green
+    fills = np.where(pct.notna(), fills, COLOURS["coffee_primary"])
+
+    # Plot the coffee provinces in one call with production-based colouring
+    central_highlands.plot(
+        ax=ax,
+        color=fills.tolist(),
+        edgecolor=COLOURS["border"],
+        linewidth=1,
+        rasterized=True,
     )
 
-    # Create colour map based on production percentage
-    def get_colour_by_production(geoname):
-        if geoname in COFFEE_DATA:
-            pct = COFFEE_DATA[geoname]["production_pct"]
-            # Interpolate green shade based on production
-            intensity = pct / 35  # Normalise to max (Dak Lak)
-            r = int(45 * (1 - intensity * 0.6))
-            g = int(124 * (0.4 + intensity * 0.6))
-            b = int(35 * (1 - intensity * 0.6))
-            return f"#{r:02x}{g:02x}{b:02x}"
-        return COLOURS["coffee_primary"]
-
-    # Plot each coffee province with production-based colouring
-    for idx, row in central_highlands.iterrows():
-        colour = get_colour_by_production(row["geoname"])
-        gpd.GeoDataFrame([row], crs=adm1.crs).plot(
-            ax=ax, color=colour, edgecolor=COLOURS["border"], linewidth=1
-        )
-
     # Add labels with production data
-    for idx, row in central_highlands.iterrows():
-        centroid = row.geometry.centroid
-        display_name = PROVINCE_DISPLAY_NAMES.get(row["geoname"], row["geoname"])
+    anchors = _label_coords(central_highlands)
+    for geoname, (x, y) in zip(central_highlands["geoname"], anchors):
+        display_name = PROVINCE_DISPLAY_NAMES.get(geoname, geoname)
 
-        if row["geoname"] in COFFEE_DATA:
-            data = COFFEE_DATA[row["geoname"]]
+        if geoname in COFFEE_DATA:
+            data = COFFEE_DATA[geoname]
             label = f"{display_name}\n{data['production_pct']}% production\n{data['area_ha']:,} ha"
         else:
             label = display_name
 
         ax.annotate(
             label,
-            xy=(centroid.x, centroid.y),
+            xy=(x, y),
             ha="center",
             va="center",
             fontsize=9,
             fontweight="bold",
             color="white",
-            path_effects=[pe.withStroke(linewidth=2, foreground="black")],
+            path_effects=LABEL_STROKE,
         )
 
     # Add Buon Ma Thuot marker
@@ -328,15 +427,9 @@ def create_central_highlands_detail_map(vnm_gdf):
     )
 
     # Colour bar / legend for production
-    from matplotlib.colors import LinearSegmentedColormap
-
-    # Create custom colourbar
-    cmap = LinearSegmentedColormap.from_list(
-        "coffee", [COLOURS["coffee_secondary"], COLOURS["dak_lak"]]
-    )
-    sm = plt.cm.ScalarMappable(cmap=cmap, norm=plt.Normalize(vmin=8, vmax=35))
+    sm = ScalarMappable(cmap=COFFEE_CMAP, norm=Normalize(vmin=8, vmax=35))
     sm.set_array([])
-    cbar = plt.colorbar(sm, ax=ax, shrink=0.3, aspect=15, pad=0.02)
+    cbar = fig.colorbar(sm, ax=ax, shrink=0.3, aspect=15, pad=0.02)
     cbar.set_label("Share of National Production (%)", fontsize=9)
 
     # Info box
@@ -365,41 +458,32 @@ def create_central_highlands_detail_map(vnm_gdf):
     ax.set_ylim(ylim)
     ax.set_axis_off()
 
-    plt.tight_layout()
-    output_path = OUTPUT_DIR / "central_highlands_coffee_detail.png"
-    plt.savefig(
+    output_path = OUTPUT_DIR / f"central_highlands_coffee_detail.{FIGURE_FORMAT}"
+    fig.savefig(
         output_path, dpi=300, bbox_inches="tight", facecolor=COLOURS["background"]
     )
-    plt.close()
     print(f"Saved: {output_path}")
     return output_path
 
 
 def create_production_comparison_chart():
     """Create a horizontal bar chart comparing coffee provinces."""
-    fig, ax = plt.subplots(1, 1, figsize=(10, 6), facecolor=COLOURS["background"])
-
-    provinces = ["Đắk Lắk", "Lâm Đồng", "Gia Lai", "Đắk Nông", "Kon Tum"]
-    production_pct = [35, 22, 18, 12, 8]
-    area_ha = [210000, 176000, 98000, 136000, 26000]
-    yields = [2850, 2900, 2750, 2700, 2600]
-
-    # Create gradient colours
-    colours = [
-        "#1B3D0F",
-        "#2D5016",
-        "#3D6A1E",
-        "#4A7C23",
-        "#5A8F2E",
-    ]
+    fig = _new_figure(
+        figsize=(10, 6), facecolor=COLOURS["background"], layout="constrained"
+    )
+    ax = fig.add_subplot()
 
+    table = PROVINCE_PRODUCTION
     bars = ax.barh(
-        provinces, production_pct, color=colours, edgecolor=COLOURS["border"]
+        table["province"],
+        table["production_pct"],
+        color=table["colour"],
+        edgecolor=COLOURS["border"],
     )
 
     # Add value labels
-    for i, (bar, pct, area, yld) in enumerate(
-        zip(bars, production_pct, area_ha, yields)
+    for bar, pct, area, yld in zip(
+        bars, table["production_pct"], table["area_ha"], table["yield_kg_ha"]
     ):
         ax.text(
             bar.get_width() + 0.5,
@@ -436,33 +520,31 @@ def create_production_comparison_chart():
         color="#666666",
     )
 
-    plt.tight_layout()
-    output_path = OUTPUT_DIR / "coffee_production_by_province.png"
-    plt.savefig(
-        output_path, dpi=300, bbox_inches="tight", facecolor=COLOURS["background"]
-    )
-    plt.close()
+    output_path = OUTPUT_DIR / f"coffee_production_by_province.{FIGURE_FORMAT}"
+    fig.savefig(output_path, dpi=300, facecolor=COLOURS["background"])
     print(f"Saved: {output_path}")
     return output_path
 
 
-def create_yield_timeline():
-    """Create a timeline chart showing yield trends."""
-    fig, ax = plt.subplots(1, 1, figsize=(12, 6), facecolor=COLOURS["background"])
+def _plot_yield_timeline(ax, compact=False):
+    """
+    Draw the yield history, 2025 marker, forecast band and ENSO
+    annotations shared by the yield chart and the infographic panel.
 
-    years = [2020, 2021, 2022, 2023, 2024, 2025, 2026, 2027]
-    yields = [2800, 2850, 2980, 2680, 2500, 2650, 2850, 2950]
+    ``compact`` switches to the infographic's smaller markers and
+    data-anchored annotations. Titles, axis labels and limits are left to
+    the caller.
+    """
+    years, yields = YIELD_YEARS, YIELD_KG_HA
 
     # Plot historical data (up to and including 2025)
-    hist_years = years[:6]  # Include 2025 in historical line
-    hist_yields = yields[:6]
     ax.plot(
-        hist_years,
-        hist_yields,
+        years[:6],
+        yields[:6],
         "o-",
         color=COLOURS["coffee_primary"],
         linewidth=2,
-        markersize=8,
+        markersize=None if compact else 8,
         label="Historical",
     )
 
@@ -472,21 +554,19 @@ def create_yield_timeline():
         [2650],
         "o",
         color=COLOURS["highlight"],
-        markersize=12,
+        markersize=10 if compact else 12,
         label="Current (2025)",
         zorder=5,
     )
 
     # Plot forecast with dashed line - connect from 2025 to remove gap
-    forecast_years = [2025] + years[6:]  # Start from 2025 to connect
-    forecast_yields = [yields[5]] + yields[6:]  # Include 2025 value
     ax.plot(
-        forecast_years,
-        forecast_yields,
+        [2025] + years[6:],
+        [yields[5]] + yields[6:],
         "o--",
         color=COLOURS["coffee_secondary"],
         linewidth=2,
-        markersize=8,
+        markersize=None if compact else 8,
         label="Forecast",
     )
 
@@ -502,36 +582,75 @@ def create_yield_timeline():
 
     # Add vertical line to mark forecast start
     ax.axvline(x=2025, color="#999999", linestyle="--", linewidth=1, alpha=0.7)
-    ax.text(
-        2025.1,
-        3350,
-        "Forecast →",
-        fontsize=9,
-        color="#666666",
-        fontweight="bold",
-        va="top",
+    if compact:
+        ax.text(2025.1, 3200, "Forecast →", fontsize=8, color="#666666", fontweight="bold")
+    else:
+        ax.text(
+            2025.1,
+            3350,
+            "Forecast →",
+            fontsize=9,
+            color="#666666",
+            fontweight="bold",
+            va="top",
+        )
+
+    ax.axhline(
+        y=2780,
+        color="#CCCCCC",
+        linestyle=":",
+        alpha=0.7 if compact else None,
+        label="5-year average",
     )
 
     # Add event annotations - El Niño drought and La Niña floods
-    events = {
-        2024: ("El Niño\ndrought", "below"),
-        2025: ("La Niña\nfloods", "below"),
-    }
-
-    for year, (text, pos) in events.items():
-        y_val = yields[years.index(year)]
-        y_offset = -180
+    if compact:
         ax.annotate(
-            text,
-            xy=(year, y_val),
-            xytext=(0, y_offset),
-            textcoords="offset points",
-            ha="center",
+            "El Niño\ndrought",
+            xy=(2024, 2500),
+            xytext=(2023.5, 2300),
             fontsize=8,
             fontweight="bold",
-            color=COLOURS["text"],
-            arrowprops=dict(arrowstyle="->", color=COLOURS["border"], lw=0.8),
+            arrowprops=dict(arrowstyle="->", color="#666666", lw=0.5),
         )
+        ax.annotate(
+            "La Niña\nfloods",
+            xy=(2025, 2650),
+            xytext=(2024.3, 2850),
+            fontsize=8,
+            fontweight="bold",
+            arrowprops=dict(arrowstyle="->", color="#666666", lw=0.5),
+        )
+    else:
+        for year, text in {2024: "El Niño\ndrought", 2025: "La Niña\nfloods"}.items():
+            ax.annotate(
+                text,
+                xy=(year, yields[years.index(year)]),
+                xytext=(0, -180),
+                textcoords="offset points",
+                ha="center",
+                fontsize=8,
+                fontweight="bold",
+                color=COLOURS["text"],
+                arrowprops=dict(arrowstyle="->", color=COLOURS["border"], lw=0.8),
+            )
+
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+
+    # Remove y-axis tick labels (per JH feedback) but keep the axis label
+    ax.set_yticklabels([])
+    ax.tick_params(axis="y", length=0)
+
+
+def create_yield_timeline():
+    """Create a timeline chart showing yield trends."""
+    fig = _new_figure(
+        figsize=(12, 6), facecolor=COLOURS["background"], layout="constrained"
+    )
+    ax = fig.add_subplot()
+
+    _plot_yield_timeline(ax)
 
     ax.set_xlabel("Year", fontsize=11)
     ax.set_ylabel("Yield (kg/ha)", fontsize=11)
@@ -545,14 +664,7 @@ def create_yield_timeline():
 
     ax.set_ylim(2000, 3500)
     ax.set_xlim(2019.5, 2027.5)
-    ax.axhline(y=2780, color="#CCCCCC", linestyle=":", label="5-year average")
     ax.legend(loc="upper left", fontsize=9)
-    ax.spines["top"].set_visible(False)
-    ax.spines["right"].set_visible(False)
-
-    # Remove y-axis tick labels (per JH feedback) but keep the axis label
-    ax.set_yticklabels([])
-    ax.tick_params(axis="y", length=0)
 
     # Add context note
     ax.text(
@@ -568,28 +680,23 @@ def create_yield_timeline():
         color="#666666",
     )
 
-    plt.tight_layout()
-    output_path = OUTPUT_DIR / "coffee_yield_timeline.png"
-    plt.savefig(
-        output_path, dpi=300, bbox_inches="tight", facecolor=COLOURS["background"]
-    )
-    plt.close()
+    output_path = OUTPUT_DIR / f"coffee_yield_timeline.{FIGURE_FORMAT}"
+    fig.savefig(output_path, dpi=300, facecolor=COLOURS["background"])
     print(f"Saved: {output_path}")
     return output_path
 
 
-def create_infographic_summary():
-    """Create a summary infographic with key statistics."""
-    fig = plt.figure(figsize=(14, 10), facecolor=COLOURS["background"])
+def create_infographic_summary(adm1):
+    """
+    Create a summary infographic with key statistics.
+
+    Takes the ADM1 provinces already flagged by identify_coffee_provinces.
+    """
+    fig = _new_figure(figsize=(14, 10), facecolor=COLOURS["background"])
 
     # Create grid
     gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.25)
 
-    # Load data
-    vnm_gdf = load_vietnam_boundaries()
-    adm1 = vnm_gdf[vnm_gdf["shapetype"] == "ADM1"].copy()
-    adm1 = identify_coffee_provinces(adm1)
-
     # Panel 1: Mini map
     ax1 = fig.add_subplot(gs[0, 0])
     ax1.set_facecolor(COLOURS["water"])
@@ -600,6 +707,7 @@ def create_infographic_summary():
         color=COLOURS["vietnam_base"],
         edgecolor=COLOURS["border"],
         linewidth=0.2,
+        rasterized=True,
     )
     coffee = adm1[adm1["is_coffee"]]
     coffee.plot(
@@ -607,6 +715,7 @@ def create_infographic_summary():
         color=COLOURS["coffee_primary"],
         edgecolor=COLOURS["border"],
         linewidth=0.3,
+        rasterized=True,
     )
     ax1.set_axis_off()
     ax1.set_title("Coffee Regions", fontsize=11, fontweight="bold")
@@ -635,17 +744,14 @@ def create_infographic_summary():
 
     # Panel 3: Province breakdown
     ax3 = fig.add_subplot(gs[0, 2])
-    provinces = ["Đắk Lắk", "Lâm Đồng", "Gia Lai", "Đắk Nông", "Kon Tum"]
-    sizes = [35, 22, 18, 12, 8]
-    colours_pie = ["#1B3D0F", "#2D5016", "#3D6A1E", "#4A7C23", "#5A8F2E"]
     explode = (0.05, 0, 0, 0, 0)
 
     wedges, texts, autotexts = ax3.pie(
-        sizes,
+        PROVINCE_PRODUCTION["production_pct"],
         explode=explode,
-        labels=provinces,
+        labels=PROVINCE_PRODUCTION["province"],
         autopct="%1.0f%%",
-        colors=colours_pie,
+        colors=PROVINCE_PRODUCTION["colour"],
         startangle=90,
     )
     for autotext in autotexts:
@@ -678,64 +784,11 @@ def create_infographic_summary():
 
     # Panel 5: Timeline mini
     ax5 = fig.add_subplot(gs[1, 1:])
-    years = [2020, 2021, 2022, 2023, 2024, 2025, 2026, 2027]
-    yields_time = [2800, 2850, 2980, 2680, 2500, 2650, 2850, 2950]
-
-    # Historical line (up to and including 2025)
-    ax5.plot(
-        years[:6], yields_time[:6], "o-", color=COLOURS["coffee_primary"], linewidth=2
-    )
-    # Highlight current year
-    ax5.plot([2025], [2650], "o", color=COLOURS["highlight"], markersize=10, zorder=5)
-    # Forecast - connect from 2025 to remove gap
-    ax5.plot(
-        [2025] + years[6:],
-        [yields_time[5]] + yields_time[6:],
-        "o--",
-        color=COLOURS["coffee_secondary"],
-        linewidth=2,
-    )
-    ax5.fill_between(
-        years[6:],
-        [y * 0.9 for y in yields_time[6:]],
-        [y * 1.1 for y in yields_time[6:]],
-        alpha=0.2,
-        color=COLOURS["coffee_secondary"],
-    )
-
-    # Vertical line to mark forecast start
-    ax5.axvline(x=2025, color="#999999", linestyle="--", linewidth=1, alpha=0.7)
-    ax5.text(2025.1, 3200, "Forecast →", fontsize=8, color="#666666", fontweight="bold")
-
-    ax5.axhline(y=2780, color="#CCCCCC", linestyle=":", alpha=0.7)
+    _plot_yield_timeline(ax5, compact=True)
     ax5.set_xlabel("Year")
     ax5.set_ylabel("Yield (kg/ha)")
     ax5.set_title("Yield Trend & Forecast", fontsize=11, fontweight="bold")
     ax5.set_ylim(2200, 3300)
-    ax5.spines["top"].set_visible(False)
-    ax5.spines["right"].set_visible(False)
-
-    # Remove y-axis tick labels (per JH feedback)
-    ax5.set_yticklabels([])
-    ax5.tick_params(axis="y", length=0)
-
-    # Add annotations - El Niño drought and La Niña floods
-    ax5.annotate(
-        "El Niño\ndrought",
-        xy=(2024, 2500),
-        xytext=(2023.5, 2300),
-        fontsize=8,
-        fontweight="bold",
-        arrowprops=dict(arrowstyle="->", color="#666666", lw=0.5),
-    )
-    ax5.annotate(
-        "La Niña\nfloods",
-        xy=(2025, 2650),
-        xytext=(2024.3, 2850),
-        fontsize=8,
-        fontweight="bold",
-        arrowprops=dict(arrowstyle="->", color="#666666", lw=0.5),
-    )
 
     # Main title
     fig.suptitle(
@@ -757,12 +810,11 @@ def create_infographic_summary():
         color="#666666",
     )
 
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    output_path = OUTPUT_DIR / "vietnam_coffee_infographic.png"
-    plt.savefig(
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
+    output_path = OUTPUT_DIR / f"vietnam_coffee_infographic.{FIGURE_FORMAT}"
+    fig.savefig(
         output_path, dpi=300, bbox_inches="tight", facecolor=COLOURS["background"]
     )
-    plt.close()
     print(f"Saved: {output_path}")
     return output_path
 
@@ -772,12 +824,31 @@ def main():
     print("Loading Vietnam boundary data...")
     vnm_gdf = load_vietnam_boundaries()
 
+    # Split and classify once, shared by every map
+    adm0 = vnm_gdf[vnm_gdf["shapetype"] == "ADM0"]
+    adm1 = identify_coffee_provinces(vnm_gdf[vnm_gdf["shapetype"] == "ADM1"].copy())
+
+    # Country-scale maps can't show detail finer than a pixel, so they get
+    # simplified outlines; the detail map keeps full resolution
+    adm1_simplified = adm1.copy()
+    adm1_simplified["geometry"] = adm1.geometry.simplify(
+        SIMPLIFY_TOLERANCE_DEG, preserve_topology=True
+    )
+
     print("\nGenerating maps and visualisations...")
-    create_vietnam_overview_map(vnm_gdf)
-    create_central_highlands_detail_map(vnm_gdf)
-    create_production_comparison_chart()
-    create_yield_timeline()
-    create_infographic_summary()
+    # The figures are independent and CPU bound to draw and save, so
+    # render them in spawned worker processes
+    with multiprocessing.get_context("spawn").Pool(min(5, os.cpu_count())) as pool:
+        results = [
+            pool.apply_async(create_vietnam_overview_map, (adm0, adm1_simplified)),
+            pool.apply_async(create_central_highlands_detail_map, (adm1,)),
+            pool.apply_async(create_production_comparison_chart),
+            pool.apply_async(create_yield_timeline),
+            pool.apply_async(create_infographic_summary, (adm1_simplified,)),
+        ]
+        # Wait for every figure, re-raising any error from the workers
+        for result in results:
+            result.get()
 
     print(f"\n✓ All outputs saved to: {OUTPUT_DIR}")
 